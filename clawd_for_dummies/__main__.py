@@ -8,6 +8,7 @@ import sys
 from typing import Optional
 
 from clawd_for_dummies.models.system_info import SystemInfo
+from clawd_for_dummies.engine.network_analyzer import NetworkAnalyzer
 from clawd_for_dummies.interface.cli import CLI
 from clawd_for_dummies.scanner import SecurityScanner
 from clawd_for_dummies.utils.logger import setup_logging
@@ -62,6 +63,23 @@ def create_parser() -> argparse.ArgumentParser:
         metavar="MODULE",
         help="Run specific scan modules only",
     )
+    scan_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results (e.g. firewall state) and re-check everything",
+    )
+    scan_group.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="Run at most N scan modules at once (default: all of them)",
+    )
+    scan_group.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Stop waiting for scan modules after SECONDS and report the rest",
+    )
 
     output_group = parser.add_argument_group("Output Options")
     output_group.add_argument(
@@ -210,7 +228,7 @@ def main(args: Optional[list] = None) -> int:
     log_level = (
         "DEBUG" if parsed_args.verbose else "WARNING" if parsed_args.silent else "INFO"
     )
-    setup_logging(log_level)
+    setup_logging(log_level, trim_record_attributes=True)
 
     if not parsed_args.silent:
         print_disclaimer()
@@ -240,10 +258,15 @@ def main(args: Optional[list] = None) -> int:
             "clawdbot",
         ]
 
+    if parsed_args.no_cache:
+        NetworkAnalyzer.clear_firewall_cache(system_info)
+
     scanner = SecurityScanner(
         modules=modules,
         system_info=system_info,
         verbose=parsed_args.verbose,
+        max_workers=parsed_args.workers,
+        per_module_timeout=parsed_args.timeout,
     )
 
     if not parsed_args.silent:
@@ -504,13 +504,17 @@ class ClawdbotConnector:
                     pass
 
         finally:
-            self._secure_data.clear_all()
-            self._session_id = ""
-            self._status = ConnectionStatus.DISCONNECTED
-            self._permission_level = PermissionLevel.NONE
-            self._connected_at = None
+            self._reset_session()
             self._log("Disconnected and cleaned up")
 
+    def _reset_session(self) -> None:
+        """Wipe session data and return to the disconnected state."""
+        self._secure_data.clear_all()
+        self._session_id = ""
+        self._status = ConnectionStatus.DISCONNECTED
+        self._permission_level = PermissionLevel.NONE
+        self._connected_at = None
+
     def __enter__(self) -> "ClawdbotConnector":
         return self
 
@@ -3,7 +3,7 @@ Abstract base class for all security scanner modules.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional, Set
 
 from clawd_for_dummies.models.finding import Finding
 from clawd_for_dummies.models.system_info import SystemInfo
@@ -16,6 +16,9 @@ class BaseScanner(ABC):
         self.system_info = system_info
         self.verbose = verbose
         self.findings: List[Finding] = []
+        self._finding_ids: Set[str] = set()
+        # Per-scan file contents shared between modules, set by SecurityScanner
+        self.file_cache: Optional[Dict[str, bytes]] = None
 
     @abstractmethod
     def scan(self) -> List[Finding]:
@@ -32,8 +35,19 @@ class BaseScanner(ABC):
         pass
 
     def add_finding(self, finding: Finding) -> None:
+        """Record a finding, ignoring repeats of an ID already reported."""
+        if finding.id in self._finding_ids:
+            return
+        self._finding_ids.add(finding.id)
         self.findings.append(finding)
 
+    def reset_findings(self) -> None:
+        """Clear the findings from a previous scan."""
+        self.findings = []
+        self._finding_ids = set()
+
     def log(self, message: str) -> None:
         if self.verbose:
-            print(f"  [{self.get_name()}] {message}")
+            # Scanners may run concurrently, so write each line in one call
+            # to keep messages from different modules from interleaving
+            print(f"  [{self.get_name()}] {message}\n", end="")
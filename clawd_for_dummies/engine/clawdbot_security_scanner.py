@@ -18,11 +18,17 @@ Note: Moltbot is the successor to Clawdbot. Both are supported.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional speedup; fall back to the stdlib parser
+    from json import loads as json_loads
 
 from clawd_for_dummies.models.finding import Finding, Severity, Category
 from clawd_for_dummies.models.system_info import SystemInfo
 from clawd_for_dummies.engine.base_scanner import BaseScanner
+from clawd_for_dummies.utils.secure import read_config_cached
 
 
 class ClawdbotSecurityScanner(BaseScanner):
@@ -42,8 +48,8 @@ class ClawdbotSecurityScanner(BaseScanner):
     - Weak/default pairing codes
     """
 
-    # Known dangerous commands that should be blocked
-    DANGEROUS_COMMANDS = [
+    # Known dangerous commands that should be blocked, in reporting order
+    DANGEROUS_COMMANDS = (
         "rm -rf",
         "rm -r /",
         "rm -rf /",
@@ -60,7 +66,8 @@ class ClawdbotSecurityScanner(BaseScanner):
         "pip install --user",
         "sudo rm",
         "sudo chmod",
-    ]
+    )
+    DANGEROUS_COMMANDS_SET = frozenset(DANGEROUS_COMMANDS)
 
     def __init__(self, system_info: SystemInfo, verbose: bool = False):
         """Initialize the Clawdbot security scanner."""
@@ -141,6 +148,13 @@ class ClawdbotSecurityScanner(BaseScanner):
     def _find_config_files(self) -> List[Path]:
         """Find Clawdbot/Moltbot configuration files.
 
+        See ``_iter_config_files`` for the search order.
+        """
+        return list(self._iter_config_files())
+
+    def _iter_config_files(self) -> Iterator[Path]:
+        """Yield Clawdbot/Moltbot configuration files as they are found.
+
         Searches for configuration files in the following order of precedence:
         1. Environment variable overrides (MOLTBOT_CONFIG_PATH, CLAWDBOT_CONFIG_PATH)
         2. State directory overrides (MOLTBOT_STATE_DIR, CLAWDBOT_STATE_DIR)
@@ -152,7 +166,6 @@ class ClawdbotSecurityScanner(BaseScanner):
         This matches the path resolution logic from the official moltbot repository:
         https://github.com/moltbot/moltbot
         """
-        config_files: List[Path] = []
         seen_paths: set[Path] = set()  # Track already-seen paths to avoid duplicates
         home = Path(self.system_info.home_directory)
         paths: List[Path] = []
@@ -167,7 +180,8 @@ class ClawdbotSecurityScanner(BaseScanner):
             explicit_path = Path(os.path.expanduser(explicit_config))
             # Validate it's a file (not a directory) before returning
             if explicit_path.exists() and explicit_path.is_file():
-                return [explicit_path]
+                yield explicit_path
+                return
 
         # Check for state directory overrides via environment variables
         moltbot_state_dir = os.environ.get("MOLTBOT_STATE_DIR", "").strip()
@@ -291,39 +305,44 @@ class ClawdbotSecurityScanner(BaseScanner):
             # for the Claude Desktop App, not Moltbot/Clawdbot
         ])
 
+        # Stat candidates lazily so callers that stop early skip the rest
         for path in paths:
             # Check existence once and ensure it's a file (not a directory)
             if path.exists() and path.is_file():
                 resolved = path.resolve()
                 if resolved not in seen_paths:
                     seen_paths.add(resolved)
-                    config_files.append(path)
-
-        return config_files
+                    yield path
 
     def analyze_config_file(self, config_file: Path) -> None:
         """Analyze a single configuration file for security issues."""
         self.log(f"Analyzing {config_file}...")
 
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
-
-            # Check for various security settings
-            self._check_dm_policy(config, config_file)
-            self._check_sandbox_settings(config, config_file)
-            self._check_dangerous_commands(config, config_file)
-            self._check_docker_network_isolation(config, config_file)
-            self._check_mcp_tools_access(config, config_file)
-            self._check_audit_logging(config, config_file)
-            self._check_pairing_codes(config, config_file)
-            self._check_prompt_injection_protection(config, config_file)
+            config = json_loads(read_config_cached(config_file, self.file_cache))
+            self.analyze_config_dict(config, config_file)
 
         except json.JSONDecodeError:
             self.log(f"Invalid JSON in {config_file}")
         except Exception as e:
             self.log(f"Error analyzing {config_file}: {e}")
 
+    def analyze_config_dict(
+        self, config: Dict[str, Any], config_file: Path = Path("<memory>")
+    ) -> None:
+        """Analyze an already-parsed configuration for security issues.
+
+        ``config_file`` is only used to label the findings.
+        """
+        self._check_dm_policy(config, config_file)
+        self._check_sandbox_settings(config, config_file)
+        self._check_dangerous_commands(config, config_file)
+        self._check_docker_network_isolation(config, config_file)
+        self._check_mcp_tools_access(config, config_file)
+        self._check_audit_logging(config, config_file)
+        self._check_pairing_codes(config, config_file)
+        self._check_prompt_injection_protection(config, config_file)
+
     def _check_dm_policy(self, config: Dict[str, Any], config_file: Path) -> None:
         """Check DM policy configuration."""
         dm_policy = None
@@ -498,13 +517,23 @@ class ClawdbotSecurityScanner(BaseScanner):
                 blocked_commands = config["security"].get("blockedCommands", [])
 
         # Check if dangerous commands are not blocked
-        dangerous_not_blocked = []
-        if blocked_commands is not None:
-            for dangerous_cmd in self.DANGEROUS_COMMANDS:
-                if dangerous_cmd not in blocked_commands:
-                    dangerous_not_blocked.append(dangerous_cmd)
+        if blocked_commands is None:
+            dangerous_not_blocked = list(self.DANGEROUS_COMMANDS)
         else:
-            dangerous_not_blocked = self.DANGEROUS_COMMANDS.copy()
+            # Hash the blocked list once so each dangerous command is an O(1)
+            # lookup; non-string entries can never match a command anyway
+            if isinstance(blocked_commands, list):
+                blocked_commands = {
+                    cmd for cmd in blocked_commands if isinstance(cmd, str)
+                }
+            if self.DANGEROUS_COMMANDS_SET.issubset(blocked_commands):
+                dangerous_not_blocked = []
+            else:
+                dangerous_not_blocked = [
+                    cmd
+                    for cmd in self.DANGEROUS_COMMANDS
+                    if cmd not in blocked_commands
+                ]
 
         if dangerous_not_blocked:
             finding = Finding(
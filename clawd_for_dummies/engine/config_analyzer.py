@@ -8,9 +8,15 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # Optional speedup; fall back to the stdlib parser
+    from json import loads as json_loads
+
 from clawd_for_dummies.models.finding import Finding, Severity, Category
 from clawd_for_dummies.models.system_info import SystemInfo
 from clawd_for_dummies.engine.base_scanner import BaseScanner
+from clawd_for_dummies.utils.secure import read_config_cached
 
 
 class ConfigAnalyzer(BaseScanner):
@@ -112,8 +118,7 @@ class ConfigAnalyzer(BaseScanner):
         self.log(f"Analyzing {config_file}...")
 
         try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = json_loads(read_config_cached(config_file, self.file_cache))
 
             # Check for security settings
             self._check_authentication(config, config_file)
@@ -158,6 +158,17 @@ class CredentialScanner(BaseScanner):
         super().__init__(system_info, verbose)
         self.findings: List[Finding] = []
 
+        # Home-relative locations are fixed for the lifetime of the scanner,
+        # so build them once instead of on every scan.
+        home = Path(system_info.home_directory)
+        self._config_dirs: Tuple[Path, ...] = (
+            home / ".config" / "moltbot",
+            home / ".config" / "clawdbot",
+            home / ".moltbot",
+            home / ".clawdbot",
+        )
+        self._specific_paths: Tuple[Path, ...] = self._build_specific_paths(home)
+
     @classmethod
     def get_name(cls) -> str:
         return "Credential Scanner"
@@ -208,21 +219,12 @@ class CredentialScanner(BaseScanner):
     def _scan_config_files(self) -> None:
         self.log("Scanning configuration files...")
 
-        home = Path(self.system_info.home_directory)
-
         # Scan Moltbot and Clawdbot directories for credentials
         # Note: Claude Desktop paths are NOT scanned as they are for
         # the Claude Desktop App, not Moltbot/Clawdbot
         # Note: Current directory (.) and config/ are NOT scanned to avoid
         # false positives from non-Moltbot/Clawdbot configuration files
-        config_dirs = [
-            home / ".config" / "moltbot",
-            home / ".config" / "clawdbot",
-            home / ".moltbot",
-            home / ".clawdbot",
-        ]
-
-        for config_dir in config_dirs:
+        for config_dir in self._config_dirs:
             if config_dir.exists():
                 self._scan_directory(config_dir)
 
@@ -248,8 +250,11 @@ class CredentialScanner(BaseScanner):
             self.log(f"Error scanning {directory}: {e}")
 
     def _scan_specific_files(self) -> None:
-        home = Path(self.system_info.home_directory)
+        for file_path in self._specific_paths:
+            if file_path.exists():
+                self._scan_file(file_path)
 
+    def _build_specific_paths(self, home: Path) -> Tuple[Path, ...]:
         # Scan Moltbot and Clawdbot config files for credentials
         # Note: Claude Desktop paths are NOT scanned as they are for
         # the Claude Desktop App, not Moltbot/Clawdbot
@@ -273,12 +278,7 @@ class CredentialScanner(BaseScanner):
                 home / "Library" / "Application Support" / "Clawdbot" / "settings.json",
             ]
         else:
-            paths = [
-                home / ".config" / "moltbot" / "settings.json",
-                home / ".config" / "clawdbot" / "settings.json",
-                home / ".moltbot" / "settings.json",
-                home / ".clawdbot" / "settings.json",
-            ]
+            paths = [config_dir / "settings.json" for config_dir in self._config_dirs]
 
         paths.extend(
             [
@@ -289,9 +289,7 @@ class CredentialScanner(BaseScanner):
             ]
         )
 
-        for file_path in paths:
-            if file_path.exists():
-                self._scan_file(file_path)
+        return tuple(paths)
 
     def _scan_file(self, file_path: Path) -> None:
         try:
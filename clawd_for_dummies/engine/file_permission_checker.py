@@ -6,7 +6,7 @@ This module checks file permissions for sensitive configuration files.
 
 import stat
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 from clawd_for_dummies.models.finding import Finding, Severity, Category
 from clawd_for_dummies.models.system_info import SystemInfo
@@ -29,6 +29,21 @@ class FilePermissionChecker(BaseScanner):
         super().__init__(system_info, verbose)
         self.findings: List[Finding] = []
 
+        # Home-relative locations are fixed for the lifetime of the scanner,
+        # so build them once instead of on every scan.
+        home = Path(system_info.home_directory)
+        self._config_dirs: Tuple[Path, ...] = (
+            home / ".config" / "moltbot",
+            home / ".config" / "clawdbot",
+            home / ".moltbot",
+            home / ".clawdbot",
+        )
+        self._sensitive_locations: Tuple[Path, ...] = self._config_dirs + (
+            home / "Library" / "Application Support" / "Moltbot",
+            home / "Library" / "Application Support" / "Clawdbot",
+        )
+        self._backup_locations: Tuple[Path, ...] = self._config_dirs
+
     @classmethod
     def get_name(cls) -> str:
         """Get scanner name."""
@@ -64,7 +79,6 @@ class FilePermissionChecker(BaseScanner):
     def _find_sensitive_files(self) -> List[Path]:
         """Find sensitive configuration files."""
         files = []
-        home = Path(self.system_info.home_directory)
 
         # Moltbot/Clawdbot specific file patterns
         patterns = [
@@ -84,16 +98,7 @@ class FilePermissionChecker(BaseScanner):
         # the Claude Desktop App, not Moltbot/Clawdbot
         # Note: Current directory (.) and config/ are NOT scanned to avoid
         # false positives from non-Moltbot/Clawdbot configuration files
-        locations = [
-            home / ".config" / "moltbot",
-            home / ".config" / "clawdbot",
-            home / ".moltbot",
-            home / ".clawdbot",
-            home / "Library" / "Application Support" / "Moltbot",
-            home / "Library" / "Application Support" / "Clawdbot",
-        ]
-
-        for location in locations:
+        for location in self._sensitive_locations:
             if location.exists():
                 for pattern in patterns:
                     if "*" in pattern:
@@ -128,8 +133,6 @@ class FilePermissionChecker(BaseScanner):
 
     def _check_backup_files(self) -> None:
         """Check for backup files that might contain sensitive data."""
-        home = Path(self.system_info.home_directory)
-
         # Backup file extensions
         backup_extensions = [".bak", ".backup", ".old", ".orig", "~"]
 
@@ -137,14 +140,7 @@ class FilePermissionChecker(BaseScanner):
         # Note: Claude Desktop paths are NOT scanned as they are for
         # the Claude Desktop App, not Moltbot/Clawdbot
         # Note: Current directory (.) is NOT scanned to avoid false positives
-        locations = [
-            home / ".config" / "moltbot",
-            home / ".config" / "clawdbot",
-            home / ".moltbot",
-            home / ".clawdbot",
-        ]
-
-        for location in locations:
+        for location in self._backup_locations:
             if location.exists():
                 for ext in backup_extensions:
                     for backup_file in location.glob(f"*{ext}"):
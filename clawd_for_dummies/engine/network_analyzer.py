@@ -4,13 +4,162 @@ Network Analyzer Module
 This module analyzes network exposure and firewall configuration.
 """
 
+import ipaddress
+import json
+import os
+import shutil
 import subprocess
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from clawd_for_dummies.models.finding import Finding, Severity, Category
 from clawd_for_dummies.models.system_info import SystemInfo
 from clawd_for_dummies.engine.base_scanner import BaseScanner
 
+# Private and loopback IPv4 ranges; anything outside these is treated as public
+_PRIVATE_NETS = tuple(
+    ipaddress.IPv4Network(cidr)
+    for cidr in ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16", "127.0.0.0/8")
+)
+
+# The same ranges as (netmask, network) integer pairs, so membership is a
+# single AND and compare per range
+_PRIVATE_MASKS = tuple(
+    (int(net.netmask), int(net.network_address)) for net in _PRIVATE_NETS
+)
+
+
+@lru_cache(maxsize=256)
+def _is_private_ip(ip: str) -> bool:
+    """Check if an IP address is in a private or loopback range.
+
+    The answer depends only on the address string, so it is cached for the
+    life of the process and repeated scans skip the parsing entirely.
+    """
+    try:
+        value = int(ipaddress.IPv4Address(ip))
+    except ValueError:
+        return False
+    return any(value & mask == network for mask, network in _PRIVATE_MASKS)
+
+
+# Firewall tools often live in sbin, which isn't always on a user's PATH
+_TOOL_SEARCH_PATH = os.pathsep.join(
+    filter(None, (os.environ.get("PATH"), "/usr/sbin", "/sbin"))
+)
+
+
+def _which(tool: str) -> Optional[str]:
+    """Resolve a tool to its absolute path, or None if it isn't installed."""
+    return shutil.which(tool, path=_TOOL_SEARCH_PATH)
+
+
+# Static parts of the findings this scanner reports, stamped out per scan via
+# Finding.copy_with
+_PUBLIC_IP_FINDING = Finding(
+    id="CLAWD-NET-001",
+    title="System Has Public IP Address",
+    description=(
+        "Your system has a public IP address directly assigned to it. "
+        "This means it's accessible from the internet without NAT or firewall protection. "
+        "If Clawdbot is exposed, attackers can reach it directly."
+    ),
+    severity=Severity.HIGH,
+    category=Category.NETWORK,
+    cvss_score=7.0,
+    location="Network interface",
+    remediation=(
+        "Place your system behind a firewall or NAT router. "
+        "Do not expose services directly to the internet without proper security."
+    ),
+    remediation_steps=[
+        "Configure a firewall to block incoming connections",
+        "Place system behind a NAT router",
+        "Use a VPN for remote access instead of exposing ports",
+        "Regularly monitor for unauthorized access attempts",
+    ],
+    reference_links=[
+        "https://www.cisa.gov/news-events/news/cisa-releases-firewall-guidance",
+    ],
+    fix_prompt=(
+        "Place this system behind a NAT router or firewall to prevent direct "
+        "internet exposure. Configure the firewall to block all incoming connections "
+        "to port 18789 from external networks. If remote access is needed, use a VPN "
+        "or SSH tunnel instead of exposing the Clawdbot port directly to the internet."
+    ),
+)
+
+_FIREWALL_FINDING = Finding(
+    id="CLAWD-NET-002",
+    title="Firewall Not Detected or Disabled",
+    description=(
+        "No active firewall was detected on your system. "
+        "A firewall helps protect your system by blocking unauthorized incoming connections. "
+        "Without a firewall, exposed services are more vulnerable to attack."
+    ),
+    severity=Severity.MEDIUM,
+    category=Category.NETWORK,
+    cvss_score=5.0,
+    evidence={
+        "firewall_status": "not detected",
+    },
+    location="System firewall",
+    remediation=("Enable and configure a firewall on your system."),
+    remediation_steps=[
+        "Windows: Open Windows Security > Firewall & network protection > Enable",
+        "macOS: System Preferences > Security & Privacy > Firewall > Turn On",
+        "Linux: Install and configure ufw, firewalld, or iptables",
+        "Block incoming connections to port 18789 unless specifically needed",
+    ],
+    reference_links=[
+        "https://www.cisa.gov/news-events/news/cisa-releases-firewall-guidance",
+    ],
+    fix_prompt=(
+        "Enable the system firewall to protect against unauthorized network access. "
+        "On Linux: 'sudo ufw enable && sudo ufw deny 18789'. "
+        "On macOS: System Preferences > Security & Privacy > Firewall > Turn On. "
+        "On Windows: Windows Security > Firewall & network protection > Turn on."
+    ),
+)
+
+_PORT_FORWARDING_FINDING = Finding(
+    id="CLAWD-NET-003",
+    title="UPnP/NAT-PMP Port Forwarding Risk",
+    description=(
+        "If your router has UPnP or NAT-PMP enabled, applications can automatically "
+        "open ports on your firewall without your knowledge. This could expose your "
+        "Clawdbot instance to the internet even if you didn't manually configure port forwarding."
+    ),
+    severity=Severity.INFO,
+    category=Category.NETWORK,
+    cvss_score=0.0,
+    evidence={
+        "note": "Manual verification required",
+    },
+    location="Router configuration",
+    remediation=(
+        "Disable UPnP/NAT-PMP on your router for better security control."
+    ),
+    remediation_steps=[
+        "Log into your router's admin interface",
+        "Find UPnP or NAT-PMP settings (usually under Advanced > NAT)",
+        "Disable UPnP and NAT-PMP",
+        "Manually configure any needed port forwards",
+    ],
+    reference_links=[
+        "https://www.us-cert.gov/ncas/alerts/TA14-017A",
+    ],
+    fix_prompt=(
+        "Log into your router's admin interface (usually 192.168.1.1 or 192.168.0.1) "
+        "and disable UPnP and NAT-PMP features. Look under Advanced > NAT or similar "
+        "settings. This prevents applications from automatically opening ports to the "
+        "internet without your knowledge. Manually configure only the port forwards you need."
+    ),
+)
+
 
 class NetworkAnalyzer(BaseScanner):
     """
@@ -25,6 +174,26 @@ class NetworkAnalyzer(BaseScanner):
 
     CLAWDBOT_PORT = 18789
 
+    # Firewall detection shells out to slow tools, so a detected firewall is
+    # cached per OS/hostname under the scanned user's home directory and
+    # reused for FIREWALL_CACHE_TTL seconds
+    FIREWALL_CACHE_PATH = Path(".cache") / "clawd" / "firewall_state.json"
+    FIREWALL_CACHE_TTL = 3600
+
+    # Firewall tools, resolved once at import so scans skip the PATH walk
+    # (and the fork) for tools that aren't installed
+    NETSH_PATH = _which("netsh")
+    SOCKETFILTERFW_PATH = "/usr/libexec/ApplicationFirewall/socketfilterfw"
+
+    SYSTEMCTL_PATH = _which("systemctl")
+
+    # Linux firewall services, queried through systemd without sudo
+    LINUX_FIREWALL_SERVICES = ("firewalld", "ufw")
+    UFW_CONFIG_FILE = "/etc/ufw/ufw.conf"
+
+    # Kernel lists of loaded netfilter tables, readable without sudo
+    LINUX_NETFILTER_TABLES = ("/proc/net/ip_tables_names", "/proc/net/nf_tables")
+
     def __init__(self, system_info: SystemInfo, verbose: bool = False):
         """Initialize the network analyzer."""
         super().__init__(system_info, verbose)
@@ -47,97 +216,74 @@ class NetworkAnalyzer(BaseScanner):
         Returns:
             List of security findings
         """
-        self.findings = []
+        self.reset_findings()
 
         self.log("Analyzing network configuration...")
 
-        # Check for public IP
-        self._check_public_ip()
-
-        # Check firewall status
-        self._check_firewall()
+        # The checks are independent and mostly wait on subprocesses, so run
+        # them concurrently; results are collected in submission order
+        checks = (
+            self._check_public_ip,
+            self._check_firewall,
+            self._check_port_forwarding,
+        )
 
-        # Check for port forwarding
-        self._check_port_forwarding()
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check in checks]
+            for future in futures:
+                for finding in future.result():
+                    self.add_finding(finding)
 
         return self.findings
 
-    def _check_public_ip(self) -> None:
+    def _check_public_ip(self) -> List[Finding]:
         """Check if system has a public IP address."""
-        # Check if any local IP is not in private ranges
-        private_ranges = [
-            ("10.0.0.0", "10.255.255.255"),
-            ("172.16.0.0", "172.31.255.255"),
-            ("192.168.0.0", "192.168.255.255"),
-            ("127.0.0.0", "127.255.255.255"),
+        findings: List[Finding] = []
+
+        # Classify each local IP once and keep the public ones for the evidence
+        public_ips = [
+            ip for ip in self.system_info.local_ips if not _is_private_ip(ip)
         ]
 
-        has_public_ip = False
-
-        for ip in self.system_info.local_ips:
-            is_private = False
-            for start, end in private_ranges:
-                if self._ip_in_range(ip, start, end):
-                    is_private = True
-                    break
-
-            if not is_private:
-                has_public_ip = True
-                break
-
-        if has_public_ip:
-            finding = Finding(
-                id="CLAWD-NET-001",
-                title="System Has Public IP Address",
-                description=(
-                    "Your system has a public IP address directly assigned to it. "
-                    "This means it's accessible from the internet without NAT or firewall protection. "
-                    "If Clawdbot is exposed, attackers can reach it directly."
-                ),
-                severity=Severity.HIGH,
-                category=Category.NETWORK,
-                cvss_score=7.0,
-                evidence={
-                    "public_ips": [
-                        ip
-                        for ip in self.system_info.local_ips
-                        if not any(
-                            self._ip_in_range(ip, s, e) for s, e in private_ranges
-                        )
-                    ],
-                },
-                location="Network interface",
-                remediation=(
-                    "Place your system behind a firewall or NAT router. "
-                    "Do not expose services directly to the internet without proper security."
-                ),
-                remediation_steps=[
-                    "Configure a firewall to block incoming connections",
-                    "Place system behind a NAT router",
-                    "Use a VPN for remote access instead of exposing ports",
-                    "Regularly monitor for unauthorized access attempts",
-                ],
-                reference_links=[
-                    "https://www.cisa.gov/news-events/news/cisa-releases-firewall-guidance",
-                ],
-                fix_prompt=(
-                    "Place this system behind a NAT router or firewall to prevent direct "
-                    "internet exposure. Configure the firewall to block all incoming connections "
-                    "to port 18789 from external networks. If remote access is needed, use a VPN "
-                    "or SSH tunnel instead of exposing the Clawdbot port directly to the internet."
-                ),
+        if public_ips:
+            finding = _PUBLIC_IP_FINDING.copy_with(
+                evidence={"public_ips": public_ips},
             )
-            self.findings.append(finding)
+            findings.append(finding)
 
-    def _check_firewall(self) -> None:
+        return findings
+
+    def _check_firewall(self) -> List[Finding]:
         """Check if firewall is enabled."""
+        findings: List[Finding] = []
+
+        firewall_enabled = self._load_cached_firewall_state()
+        if firewall_enabled is None:
+            firewall_enabled = self._detect_firewall()
+            # A negative answer may come from a missing tool or a failed
+            # probe, so only a detected firewall is cached
+            if firewall_enabled:
+                self._save_firewall_state(firewall_enabled)
+
+        if not firewall_enabled:
+            finding = _FIREWALL_FINDING.copy_with()
+            findings.append(finding)
+
+        return findings
+
+    def _detect_firewall(self) -> bool:
+        """Probe the platform firewall tools to see if a firewall is active."""
         firewall_enabled = False
 
         try:
             if self.system_info.is_windows:
+                if self.NETSH_PATH is None:
+                    self.log("netsh not found, skipping firewall check")
+                    return False
+
                 # Check Windows Firewall
                 result = subprocess.run(
-                    ["netsh", "advfirewall", "show", "currentprofile"],
+                    [self.NETSH_PATH, "advfirewall", "show", "currentprofile"],
                     capture_output=True,
                     text=True,
                     timeout=5,
@@ -145,13 +291,13 @@ class NetworkAnalyzer(BaseScanner):
                 firewall_enabled = "ON" in result.stdout or "State ON" in result.stdout
 
             elif self.system_info.is_macos:
+                if not os.path.exists(self.SOCKETFILTERFW_PATH):
+                    self.log("socketfilterfw not found, skipping firewall check")
+                    return False
+
                 # Check macOS firewall
                 result = subprocess.run(
-                    [
-                        "sudo",
-                        "/usr/libexec/ApplicationFirewall/socketfilterfw",
-                        "--getglobalstate",
-                    ],
+                    ["sudo", self.SOCKETFILTERFW_PATH, "--getglobalstate"],
                     capture_output=True,
                     text=True,
                     timeout=5,
@@ -159,83 +305,136 @@ class NetworkAnalyzer(BaseScanner):
                 firewall_enabled = "enabled" in result.stdout.lower()
 
             else:  # Linux
-                # Check various firewall tools
-                for cmd in ["ufw", "firewalld", "iptables"]:
-                    try:
-                        if cmd == "ufw":
-                            result = subprocess.run(
-                                ["sudo", "ufw", "status"],
-                                capture_output=True,
-                                text=True,
-                                timeout=5,
-                            )
-                            firewall_enabled = "active" in result.stdout.lower()
-                        elif cmd == "firewalld":
-                            result = subprocess.run(
-                                ["sudo", "firewall-cmd", "--state"],
-                                capture_output=True,
-                                text=True,
-                                timeout=5,
-                            )
-                            firewall_enabled = result.returncode == 0
-                        elif cmd == "iptables":
-                            result = subprocess.run(
-                                ["sudo", "iptables", "-L", "-n"],
-                                capture_output=True,
-                                text=True,
-                                timeout=5,
-                            )
-                            # Check if there are any rules
-                            firewall_enabled = (
-                                len(result.stdout.strip().split("\n")) > 2
-                            )
-
-                        if firewall_enabled:
-                            break
-
-                    except (subprocess.TimeoutExpired, FileNotFoundError):
-                        continue
+                # Both checks run unprivileged, so no sudo password prompt
+                firewall_enabled = (
+                    self._linux_netfilter_active()
+                    or self._linux_firewall_service_active()
+                )
 
         except Exception as e:
             self.log(f"Error checking firewall: {e}")
 
-        if not firewall_enabled:
-            finding = Finding(
-                id="CLAWD-NET-002",
-                title="Firewall Not Detected or Disabled",
-                description=(
-                    "No active firewall was detected on your system. "
-                    "A firewall helps protect your system by blocking unauthorized incoming connections. "
-                    "Without a firewall, exposed services are more vulnerable to attack."
-                ),
-                severity=Severity.MEDIUM,
-                category=Category.NETWORK,
-                cvss_score=5.0,
-                evidence={
-                    "firewall_status": "not detected",
-                },
-                location="System firewall",
-                remediation=("Enable and configure a firewall on your system."),
-                remediation_steps=[
-                    "Windows: Open Windows Security > Firewall & network protection > Enable",
-                    "macOS: System Preferences > Security & Privacy > Firewall > Turn On",
-                    "Linux: Install and configure ufw, firewalld, or iptables",
-                    "Block incoming connections to port 18789 unless specifically needed",
-                ],
-                reference_links=[
-                    "https://www.cisa.gov/news-events/news/cisa-releases-firewall-guidance",
-                ],
-                fix_prompt=(
-                    "Enable the system firewall to protect against unauthorized network access. "
-                    "On Linux: 'sudo ufw enable && sudo ufw deny 18789'. "
-                    "On macOS: System Preferences > Security & Privacy > Firewall > Turn On. "
-                    "On Windows: Windows Security > Firewall & network protection > Turn on."
-                ),
-            )
-            self.findings.append(finding)
+        return firewall_enabled
+
+    def _linux_netfilter_active(self) -> bool:
+        """Check the world-readable netfilter table lists for a loaded table.
+
+        Only a positive answer is trusted: an empty or missing list can still
+        mean nftables rules the kernel doesn't expose here, so callers fall
+        back to asking systemd about the firewall services in that case.
+        """
+        if not self.system_info.is_linux:
+            return False
+
+        for path in self.LINUX_NETFILTER_TABLES:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    if f.read().strip():
+                        return True
+            except OSError:
+                continue
+
+        return False
+
+    def _linux_firewall_service_active(self) -> bool:
+        """Ask systemd whether firewalld or ufw is running."""
+        if self.SYSTEMCTL_PATH is None:
+            return False
+
+        for service in self.LINUX_FIREWALL_SERVICES:
+            try:
+                result = subprocess.run(
+                    [self.SYSTEMCTL_PATH, "is-active", "--quiet", service],
+                    capture_output=True,
+                    timeout=2,
+                )
+            except subprocess.TimeoutExpired:
+                continue
+
+            if result.returncode != 0:
+                continue
+            # The ufw unit stays active after `ufw disable`, so check its config
+            if service == "ufw" and not self._ufw_enabled():
+                continue
+            return True
+
+        return False
+
+    def _ufw_enabled(self) -> bool:
+        """Read ENABLED from ufw.conf, assuming enabled if it can't be read."""
+        try:
+            with open(self.UFW_CONFIG_FILE, "r", encoding="utf-8") as f:
+                for line in f:
+                    key, _, value = line.strip().partition("=")
+                    if key == "ENABLED":
+                        return value.strip("'\"").lower() == "yes"
+        except OSError:
+            pass
+        return True
+
+    @classmethod
+    def firewall_cache_file(cls, system_info: SystemInfo) -> Path:
+        """Return the firewall cache location for the given user."""
+        home = system_info.home_directory or os.path.expanduser("~")
+        return Path(home) / cls.FIREWALL_CACHE_PATH
+
+    def _firewall_cache_key(self) -> str:
+        """Build the cache key for the current host."""
+        return f"{self.system_info.os_name}:{self.system_info.hostname}"
+
+    def _read_firewall_cache(self) -> Dict[str, Any]:
+        """Read the on-disk firewall cache, returning an empty dict on failure."""
+        try:
+            cache_file = self.firewall_cache_file(self.system_info)
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _load_cached_firewall_state(self) -> Optional[bool]:
+        """Return the cached firewall state, or None if missing or expired."""
+        entry = self._read_firewall_cache().get(self._firewall_cache_key())
+        if not isinstance(entry, dict):
+            return None
+
+        timestamp = entry.get("ts")
+        if not isinstance(timestamp, (int, float)):
+            return None
+        if time.time() - timestamp > self.FIREWALL_CACHE_TTL:
+            return None
+
+        self.log("Using cached firewall state")
+        return bool(entry.get("enabled"))
+
+    def _save_firewall_state(self, enabled: bool) -> None:
+        """Store the firewall state in the on-disk cache."""
+        cache = self._read_firewall_cache()
+        cache[self._firewall_cache_key()] = {
+            "enabled": enabled,
+            "ts": time.time(),
+        }
+
+        cache_file = self.firewall_cache_file(self.system_info)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            self.log(f"Could not write firewall cache: {e}")
+
+    @classmethod
+    def clear_firewall_cache(cls, system_info: SystemInfo) -> None:
+        """Remove the cached firewall state so the next scan re-probes."""
+        try:
+            cls.firewall_cache_file(system_info).unlink()
+        except FileNotFoundError:
+            pass
 
-    def _check_port_forwarding(self) -> None:
+    def _check_port_forwarding(self) -> List[Finding]:
         """Check for UPnP/NAT-PMP port forwarding."""
+        findings: List[Finding] = []
+
         # This is a simplified check - full UPnP detection would require additional libraries
 
         # Check if we can detect any port forwarding
@@ -244,58 +443,7 @@ class NetworkAnalyzer(BaseScanner):
         self.log("Note: Full port forwarding detection requires external check")
 
         # Add informational finding about UPnP risks
-        finding = Finding(
-            id="CLAWD-NET-003",
-            title="UPnP/NAT-PMP Port Forwarding Risk",
-            description=(
-                "If your router has UPnP or NAT-PMP enabled, applications can automatically "
-                "open ports on your firewall without your knowledge. This could expose your "
-                "Clawdbot instance to the internet even if you didn't manually configure port forwarding."
-            ),
-            severity=Severity.INFO,
-            category=Category.NETWORK,
-            cvss_score=0.0,
-            evidence={
-                "note": "Manual verification required",
-            },
-            location="Router configuration",
-            remediation=(
-                "Disable UPnP/NAT-PMP on your router for better security control."
-            ),
-            remediation_steps=[
-                "Log into your router's admin interface",
-                "Find UPnP or NAT-PMP settings (usually under Advanced > NAT)",
-                "Disable UPnP and NAT-PMP",
-                "Manually configure any needed port forwards",
-            ],
-            reference_links=[
-                "https://www.us-cert.gov/ncas/alerts/TA14-017A",
-            ],
-            fix_prompt=(
-                "Log into your router's admin interface (usually 192.168.1.1 or 192.168.0.1) "
-                "and disable UPnP and NAT-PMP features. Look under Advanced > NAT or similar "
-                "settings. This prevents applications from automatically opening ports to the "
-                "internet without your knowledge. Manually configure only the port forwards you need."
-            ),
-        )
-        self.findings.append(finding)
+        finding = _PORT_FORWARDING_FINDING.copy_with()
+        findings.append(finding)
 
-    def _ip_in_range(self, ip: str, start: str, end: str) -> bool:
-        """Check if an IP address is within a range."""
-        try:
-            ip_int = self._ip_to_int(ip)
-            start_int = self._ip_to_int(start)
-            end_int = self._ip_to_int(end)
-            return start_int <= ip_int <= end_int
-        except Exception:
-            return False
-
-    def _ip_to_int(self, ip: str) -> int:
-        """Convert IP address to integer."""
-        parts = ip.split(".")
-        return (
-            (int(parts[0]) << 24)
-            + (int(parts[1]) << 16)
-            + (int(parts[2]) << 8)
-            + int(parts[3])
-        )
+        return findings
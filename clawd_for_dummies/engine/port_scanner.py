@@ -2,20 +2,103 @@
 Port scanner for detecting exposed Clawdbot gateway and authentication issues.
 """
 
+import errno
+import http.client
+import io
+import os
 import socket
 import subprocess
-from typing import List
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
 
 from clawd_for_dummies.models.finding import Finding, Severity, Category
 from clawd_for_dummies.models.system_info import SystemInfo
 from clawd_for_dummies.engine.base_scanner import BaseScanner
 
+# Static parts of the findings this scanner reports; evidence and location
+# are filled in per scan via Finding.copy_with
+_EXPOSED_PORT_FINDING = Finding(
+    id="CLAWD-PORT-001",
+    title="Clawdbot Gateway Exposed to Network",
+    description=(
+        "Your Clawdbot gateway (port 18789) is bound to 0.0.0.0, "
+        "meaning it's accessible from ANY computer on your network "
+        "or the internet. This allows anyone to connect to your "
+        "Clawdbot instance without authentication."
+    ),
+    severity=Severity.CRITICAL,
+    category=Category.PORT,
+    cvss_score=9.8,
+    remediation=(
+        "Configure Clawdbot to bind only to localhost (127.0.0.1) "
+        "or enable authentication."
+    ),
+    remediation_steps=[
+        "Open your Clawdbot configuration file",
+        "Find the 'gateway' or 'server' section",
+        "Change 'bind' from '0.0.0.0' to '127.0.0.1'",
+        "Alternatively, enable authentication with 'requireAuthentication: true'",
+        "Restart Moltbot/Clawdbot to apply changes",
+    ],
+    reference_links=[
+        "https://github.com/jasondsmith72/Clawdbot",
+        "https://docs.clawdbot.dev/security",
+    ],
+    fix_prompt=(
+        "Bind the Clawdbot gateway to 127.0.0.1 instead of 0.0.0.0 to prevent "
+        "network exposure. Update the gateway.host or bind setting in moltbot.json "
+        "to '127.0.0.1' and restart the service. If remote access is required, "
+        "enable authentication with 'requireAuthentication: true' and set a strong authToken."
+    ),
+)
+
+_AUTH_BYPASS_FINDING = Finding(
+    id="CLAWD-AUTH-001",
+    title="Authentication Bypass Vulnerability",
+    description=(
+        "Your Clawdbot gateway accepted a connection without "
+        "requiring authentication. This is likely due to the "
+        "reverse proxy authentication bypass vulnerability where "
+        "all external traffic appears as localhost (127.0.0.1), "
+        "triggering auto-approval. Attackers can exploit this to "
+        "gain full access to your Clawdbot instance."
+    ),
+    severity=Severity.CRITICAL,
+    category=Category.AUTHENTICATION,
+    cvss_score=10.0,
+    remediation=(
+        "Enable authentication in Clawdbot configuration immediately. "
+        "Do not rely on localhost auto-approval when behind a reverse proxy."
+    ),
+    remediation_steps=[
+        "Open your Clawdbot/Moltbot configuration file (moltbot.json or clawdbot.json)",
+        "Add or set 'requireAuthentication' to true",
+        "Set a strong password in 'authToken' or 'password' field",
+        "If using a reverse proxy, ensure auth is enabled",
+        "Restart Moltbot/Clawdbot to apply changes",
+        "Test that authentication is required by trying to connect",
+    ],
+    reference_links=[
+        "https://github.com/jasondsmith72/Clawdbot",
+        "https://www.reddit.com/r/ChatGPT/comments/1qodjzm/",
+    ],
+    fix_prompt=(
+        "Enable authentication in the Clawdbot/Moltbot configuration to fix "
+        "this critical vulnerability. Open moltbot.json or clawdbot.json, set "
+        "'requireAuthentication' to true, and add a strong 'authToken' value "
+        "(use a random 32+ character string). If behind a reverse proxy, never "
+        "rely on localhost auto-approval. Restart the service after changes."
+    ),
+)
+
 
 class PortScanner(BaseScanner):
     """Scans for exposed ports and authentication bypass vulnerabilities."""
 
     CLAWDBOT_PORT = 18789
 
+    PROC_NET_TCP_TABLES = ("/proc/net/tcp", "/proc/net/tcp6")
+
     def __init__(self, system_info: SystemInfo, verbose: bool = False):
         super().__init__(system_info, verbose)
         self.findings: List[Finding] = []
@@ -29,7 +112,7 @@ class PortScanner(BaseScanner):
         return "Checks for exposed ports and authentication bypass vulnerabilities"
 
     def scan(self) -> List[Finding]:
-        self.findings = []
+        self.reset_findings()
         self.log("Checking Clawdbot gateway port...")
 
         port_status = self._check_port_status(self.CLAWDBOT_PORT)
@@ -61,25 +144,197 @@ class PortScanner(BaseScanner):
         }
 
         try:
+            if self._is_port_in_use(port):
+                result["is_listening"] = True
+                result.update(self._get_port_info(port))
+
+        except Exception as e:
+            self.log(f"Error checking port: {e}")
+
+        return result
+
+    def _is_port_in_use(self, port: int) -> bool:
+        """Check whether something is bound to the port on localhost.
+
+        On POSIX systems this tries to bind the port ourselves, which fails
+        with EADDRINUSE if it is taken, without sending any traffic to the
+        gateway. Windows lets a specific-address bind succeed alongside a
+        wildcard listener, so there we fall back to a connect probe. Linux
+        refuses a bind over a live listener even with SO_REUSEADDR, so the
+        flag is set there to keep TIME_WAIT leftovers from counting as
+        in use.
+        """
+        if self.system_info.is_windows:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(2)
+            try:
+                return sock.connect_ex(("127.0.0.1", port)) == 0
+            finally:
+                sock.close()
 
-            localhost_result = sock.connect_ex(("127.0.0.1", port))
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            reuse = 1 if self.system_info.is_linux else 0
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, reuse)
+            sock.bind(("127.0.0.1", port))
+            return False
+        except OSError as e:
+            return e.errno in (errno.EADDRINUSE, errno.EACCES)
+        finally:
             sock.close()
 
-            if localhost_result == 0:
-                result["is_listening"] = True
+    def _get_port_info(self, port: int) -> dict:
+        """Look up who is listening on a port.
 
-                if self.system_info.is_windows:
-                    result.update(self._get_windows_port_info(port))
-                else:
-                    result.update(self._get_unix_port_info(port))
+        On Linux the kernel socket tables in /proc/net are read directly.
+        Elsewhere (or if /proc is unavailable) psutil is used, falling back to
+        the platform's netstat/lsof output when psutil is missing or not
+        permitted to list connections (e.g. macOS without root).
+        """
+        if self.system_info.is_linux:
+            info = self._get_proc_net_port_info(port)
+            if info is not None:
+                return info
 
-        except Exception as e:
-            self.log(f"Error checking port: {e}")
+        try:
+            info = self._get_psutil_port_info(port)
+            if info is not None:
+                return info
+        except ImportError:
+            self.log("psutil not available, falling back to system tools")
+
+        if self.system_info.is_windows:
+            return self._get_windows_port_info(port)
+        return self._get_unix_port_info(port)
+
+    def _get_psutil_port_info(self, port: int) -> Optional[dict]:
+        """Get port info from psutil, or None if connections can't be listed.
+
+        Raises:
+            ImportError: If psutil is not available
+        """
+        import psutil
+
+        try:
+            conn = self._find_listening_conn(port)
+        except psutil.AccessDenied:
+            self.log("Not permitted to list connections via psutil")
+            return None
+
+        result = {"bind_address": "unknown", "process_name": None, "pid": None}
+        if conn is None:
+            return result
+
+        result["bind_address"] = self._normalize_bind_address(conn.laddr.ip)
+
+        if conn.pid is not None:
+            result["pid"] = str(conn.pid)
+            try:
+                result["process_name"] = psutil.Process(conn.pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        return result
+
+    def _get_proc_net_port_info(self, port: int) -> Optional[dict]:
+        """Get port info from /proc/net/tcp{,6}, or None if /proc is unreadable."""
+        result = {"bind_address": "unknown", "process_name": None, "pid": None}
+        port_hex = f"{port:04X}"
+        listening = None
+        tables_read = 0
+
+        for table in self.PROC_NET_TCP_TABLES:
+            try:
+                with open(table, "r", encoding="ascii") as f:
+                    listening = self._scan_proc_net_tcp(f, port_hex)
+            except OSError:
+                continue
+            tables_read += 1
+            if listening is not None:
+                break
+
+        if not tables_read:
+            return None
+        if listening is None:
+            return result
+
+        ip, inode = listening
+        result["bind_address"] = self._normalize_bind_address(ip)
+
+        pid = self._find_socket_owner(inode)
+        if pid is not None:
+            result["pid"] = pid
+            try:
+                with open(f"/proc/{pid}/comm", "r", encoding="utf-8") as f:
+                    result["process_name"] = f.read().strip()
+            except OSError:
+                pass
 
         return result
 
+    @staticmethod
+    def _scan_proc_net_tcp(
+        lines: Iterable[str], port_hex: str
+    ) -> Optional[Tuple[str, str]]:
+        """Find the listening socket for a port in a /proc/net/tcp{,6} table.
+
+        Returns the decoded local IP and the socket inode, or None.
+        """
+        for line in islice(lines, 1, None):  # Skip header
+            parts = line.split()
+            if len(parts) < 10:
+                continue
+            local_address, state, inode = parts[1], parts[3], parts[9]
+            hex_ip, _, hex_port = local_address.partition(":")
+            if hex_port == port_hex and state == "0A":  # 0A = TCP_LISTEN
+                # Addresses are stored as 32-bit words in host (little-endian) order
+                raw = b"".join(
+                    bytes.fromhex(hex_ip[i : i + 8])[::-1]
+                    for i in range(0, len(hex_ip), 8)
+                )
+                family = socket.AF_INET if len(raw) == 4 else socket.AF_INET6
+                return socket.inet_ntop(family, raw), inode
+        return None
+
+    @staticmethod
+    def _find_socket_owner(inode: str) -> Optional[str]:
+        """Find the pid holding a socket inode by walking /proc/<pid>/fd."""
+        target = f"socket:[{inode}]"
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            fd_dir = f"/proc/{pid}/fd"
+            try:
+                for fd in os.listdir(fd_dir):
+                    if os.readlink(f"{fd_dir}/{fd}") == target:
+                        return pid
+            except OSError:
+                continue
+        return None
+
+    @staticmethod
+    def _normalize_bind_address(ip: str) -> str:
+        """Collapse wildcard and loopback addresses to their IPv4 spelling."""
+        if ip in ("0.0.0.0", "::", "*", ""):
+            return "0.0.0.0"
+        if ip.startswith("127.") or ip == "::1":
+            return "127.0.0.1"
+        return ip
+
+    @staticmethod
+    def _find_listening_conn(port: int):
+        """Return the first TCP connection listening on the given port."""
+        import psutil
+
+        for conn in psutil.net_connections(kind="tcp"):
+            if (
+                conn.status == psutil.CONN_LISTEN
+                and conn.laddr
+                and conn.laddr.port == port
+            ):
+                return conn
+        return None
+
     def _get_windows_port_info(self, port: int) -> dict:
         result = {"bind_address": "unknown", "process_name": None, "pid": None}
 
@@ -90,7 +345,8 @@ class PortScanner(BaseScanner):
                 stderr=subprocess.DEVNULL,
             )
 
-            for line in output.split("\n"):
+            # Iterate lazily - we stop at the first matching listener
+            for line in io.StringIO(output):
                 if f":{port}" in line and "LISTENING" in line:
                     parts = line.split()
                     if len(parts) >= 4:
@@ -117,7 +373,9 @@ class PortScanner(BaseScanner):
                     stderr=subprocess.DEVNULL,
                 )
 
-                for line in output.split("\n")[1:]:
+                lines = io.StringIO(output)
+                next(lines, None)  # Skip the header row
+                for line in lines:
                     parts = line.split()
                     if len(parts) >= 9:
                         name_field = parts[8]
@@ -137,7 +395,7 @@ class PortScanner(BaseScanner):
                     stderr=subprocess.DEVNULL,
                 )
 
-                for line in output.split("\n"):
+                for line in io.StringIO(output):
                     if f":{port}" in line:
                         parts = line.split()
                         if len(parts) >= 4:
@@ -164,42 +422,28 @@ class PortScanner(BaseScanner):
     def _check_auth_bypass(self) -> None:
         self.log("Checking for authentication bypass...")
 
-        try:
-            import urllib.request
-
-            req = urllib.request.Request(
-                f"http://127.0.0.1:{self.CLAWDBOT_PORT}/",
-                method="GET",
-            )
-
-            try:
-                response = urllib.request.urlopen(req, timeout=5)
+        # Talk to the gateway directly rather than through urllib, which would
+        # honour HTTP_PROXY and could route this localhost probe via a proxy
+        conn = http.client.HTTPConnection("127.0.0.1", self.CLAWDBOT_PORT, timeout=5)
 
-                if response.status == 200:
-                    self._add_auth_bypass_finding()
+        try:
+            conn.request("GET", "/")
+            response = conn.getresponse()
 
-            except urllib.error.HTTPError as e:
-                if e.code == 401:
-                    self.log("Authentication required (good)")
-                else:
-                    self.log(f"HTTP error: {e.code}")
+            if response.status == 200:
+                self._add_auth_bypass_finding()
+            elif response.status == 401:
+                self.log("Authentication required (good)")
+            else:
+                self.log(f"HTTP error: {response.status}")
 
         except Exception as e:
             self.log(f"Could not test auth bypass: {e}")
+        finally:
+            conn.close()
 
     def _add_exposed_port_finding(self, port_status: dict) -> None:
-        finding = Finding(
-            id="CLAWD-PORT-001",
-            title="Clawdbot Gateway Exposed to Network",
-            description=(
-                "Your Clawdbot gateway (port 18789) is bound to 0.0.0.0, "
-                "meaning it's accessible from ANY computer on your network "
-                "or the internet. This allows anyone to connect to your "
-                "Clawdbot instance without authentication."
-            ),
-            severity=Severity.CRITICAL,
-            category=Category.PORT,
-            cvss_score=9.8,
+        finding = _EXPOSED_PORT_FINDING.copy_with(
             evidence={
                 "port": self.CLAWDBOT_PORT,
                 "bind_address": port_status.get("bind_address"),
@@ -207,74 +451,17 @@ class PortScanner(BaseScanner):
                 "pid": port_status.get("pid"),
             },
             location=f"Port {self.CLAWDBOT_PORT} bound to 0.0.0.0",
-            remediation=(
-                "Configure Clawdbot to bind only to localhost (127.0.0.1) "
-                "or enable authentication."
-            ),
-            remediation_steps=[
-                "Open your Clawdbot configuration file",
-                "Find the 'gateway' or 'server' section",
-                "Change 'bind' from '0.0.0.0' to '127.0.0.1'",
-                "Alternatively, enable authentication with 'requireAuthentication: true'",
-                "Restart Moltbot/Clawdbot to apply changes",
-            ],
-            reference_links=[
-                "https://github.com/jasondsmith72/Clawdbot",
-                "https://docs.clawdbot.dev/security",
-            ],
-            fix_prompt=(
-                "Bind the Clawdbot gateway to 127.0.0.1 instead of 0.0.0.0 to prevent "
-                "network exposure. Update the gateway.host or bind setting in moltbot.json "
-                "to '127.0.0.1' and restart the service. If remote access is required, "
-                "enable authentication with 'requireAuthentication: true' and set a strong authToken."
-            ),
         )
 
-        self.findings.append(finding)
+        self.add_finding(finding)
 
     def _add_auth_bypass_finding(self) -> None:
-        finding = Finding(
-            id="CLAWD-AUTH-001",
-            title="Authentication Bypass Vulnerability",
-            description=(
-                "Your Clawdbot gateway accepted a connection without "
-                "requiring authentication. This is likely due to the "
-                "reverse proxy authentication bypass vulnerability where "
-                "all external traffic appears as localhost (127.0.0.1), "
-                "triggering auto-approval. Attackers can exploit this to "
-                "gain full access to your Clawdbot instance."
-            ),
-            severity=Severity.CRITICAL,
-            category=Category.AUTHENTICATION,
-            cvss_score=10.0,
+        finding = _AUTH_BYPASS_FINDING.copy_with(
             evidence={
                 "port": self.CLAWDBOT_PORT,
                 "test_method": "HTTP request without credentials",
             },
             location=f"Port {self.CLAWDBOT_PORT}",
-            remediation=(
-                "Enable authentication in Clawdbot configuration immediately. "
-                "Do not rely on localhost auto-approval when behind a reverse proxy."
-            ),
-            remediation_steps=[
-                "Open your Clawdbot/Moltbot configuration file (moltbot.json or clawdbot.json)",
-                "Add or set 'requireAuthentication' to true",
-                "Set a strong password in 'authToken' or 'password' field",
-                "If using a reverse proxy, ensure auth is enabled",
-                "Restart Moltbot/Clawdbot to apply changes",
-                "Test that authentication is required by trying to connect",
-            ],
-            reference_links=[
-                "https://github.com/jasondsmith72/Clawdbot",
-                "https://www.reddit.com/r/ChatGPT/comments/1qodjzm/",
-            ],
-            fix_prompt=(
-                "Enable authentication in the Clawdbot/Moltbot configuration to fix "
-                "this critical vulnerability. Open moltbot.json or clawdbot.json, set "
-                "'requireAuthentication' to true, and add a strong 'authToken' value "
-                "(use a random 32+ character string). If behind a reverse proxy, never "
-                "rely on localhost auto-approval. Restart the service after changes."
-            ),
         )
 
-        self.findings.append(finding)
+        self.add_finding(finding)
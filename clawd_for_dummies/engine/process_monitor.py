@@ -4,12 +4,77 @@ Process Monitor Module
 This module monitors Clawdbot processes for security issues.
 """
 
+import re
 from typing import List
 
+try:
+    import psutil
+except ImportError:  # Process checks are skipped if psutil is missing
+    psutil = None
+
 from clawd_for_dummies.models.finding import Finding, Severity, Category
 from clawd_for_dummies.models.system_info import SystemInfo
 from clawd_for_dummies.engine.base_scanner import BaseScanner
 
+# Moltbot/Clawdbot process keywords, matched case-insensitively so names and
+# cmdlines don't need a lowercased copy
+# Note: "claude" is NOT included as it refers to Claude Desktop, not
+# Moltbot/Clawdbot
+_CLAWD_KEYWORD_RE = re.compile(r"clawdbot|moltbot|mcp-gateway", re.IGNORECASE)
+
+# Patterns that might indicate secrets in cmdline, fused into one alternation
+# so the command line is scanned once; the matching group names the pattern.
+# Matches don't overlap, so text consumed by one alternative can't also match
+# the other: "--token -p hunter2" reports only the API key pattern, where two
+# separate passes would also have reported the password. That is an accepted
+# cost of the single pass; the process is still flagged.
+_SECRET_PATTERN = re.compile(
+    r"(?P<api_key>--(?:api-?key|token|password|secret)[=\s]+[^\s]+)"
+    r"|(?P<password>-p[=\s]+[^\s]+)",
+    re.IGNORECASE,
+)
+_SECRET_DESCRIPTIONS = {
+    "api_key": "API key/token in command line",
+    "password": "Possible password in command line",
+}
+
+
+# Static parts of the cmdline secret finding; evidence and location are
+# filled in per process via Finding.copy_with
+_CMDLINE_SECRET_FINDING = Finding(
+    id="CLAWD-PROC-002",
+    title="Potential Secret Exposed in Process Arguments",
+    description=(
+        "A potential secret was found in the command line "
+        "arguments of the Clawdbot process. Command line "
+        "arguments are visible to all users on the system "
+        "through tools like 'ps' or Task Manager."
+    ),
+    severity=Severity.HIGH,
+    category=Category.CREDENTIAL,
+    cvss_score=7.5,
+    remediation=(
+        "Move secrets to configuration files or environment variables "
+        "instead of command line arguments."
+    ),
+    remediation_steps=[
+        "Stop the Clawdbot process",
+        "Move the secret to a configuration file",
+        "Or use environment variables (less secure but better than cmdline)",
+        "Restart Moltbot/Clawdbot without the secret in arguments",
+    ],
+    reference_links=[
+        "https://www.netmeister.org/blog/passing-passwords.html",
+    ],
+    fix_prompt=(
+        "Remove the secret from command line arguments and move it to a "
+        "configuration file instead. Stop the process, add the secret to "
+        "moltbot.json or clawdbot.json (e.g., '\"authToken\": \"<secret>\"'), "
+        "set file permissions to 600, and restart the service without "
+        "passing secrets via command line flags."
+    ),
+)
+
 
 class ProcessMonitor(BaseScanner):
     """
@@ -47,8 +112,12 @@ class ProcessMonitor(BaseScanner):
 
         self.log("Checking Clawdbot processes...")
 
+        if psutil is None:
+            self.log("psutil not available, skipping process checks")
+            return self.findings
+
         try:
-            # Find Clawdbot processes (this will raise ImportError if psutil unavailable)
+            # Find Clawdbot processes
             clawdbot_processes = self._find_clawdbot_processes()
 
             if not clawdbot_processes:
@@ -58,38 +127,27 @@ class ProcessMonitor(BaseScanner):
             for proc in clawdbot_processes:
                 self._analyze_process(proc)
 
-        except ImportError:
-            self.log("psutil not available, skipping process checks")
         except Exception as e:
             self.log(f"Error checking processes: {e}")
 
         return self.findings
 
     def _find_clawdbot_processes(self) -> List:
-        """Find Clawdbot-related processes.
-
-        Raises:
-            ImportError: If psutil is not available
-        """
-        import psutil
-
+        """Find Clawdbot-related processes."""
         processes = []
 
         try:
-            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+            # Fetch fields lazily: the name is cheap, and the cmdline is only
+            # read for processes whose name doesn't already match
+            for proc in psutil.process_iter():
                 try:
-                    name = proc.info.get("name", "").lower()
-                    cmdline = proc.info.get("cmdline", []) or []
-                    cmdline_str = " ".join(cmdline).lower()
-
-                    # Check for Moltbot/Clawdbot-related processes only
-                    # Note: "claude" is NOT included as it refers to Claude Desktop,
-                    # not Moltbot/Clawdbot
-                    if any(
-                        keyword in name or keyword in cmdline_str
-                        for keyword in ["clawdbot", "moltbot", "mcp-gateway"]
-                    ):
-                        processes.append(proc)
+                    name = proc.name() or ""
+                    if not _CLAWD_KEYWORD_RE.search(name):
+                        cmdline_str = " ".join(proc.cmdline() or [])
+                        if not _CLAWD_KEYWORD_RE.search(cmdline_str):
+                            continue
+
+                    processes.append(proc)
 
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
@@ -102,19 +160,14 @@ class ProcessMonitor(BaseScanner):
     def _analyze_process(self, proc) -> None:
         """Analyze a single process for security issues."""
         try:
-            import psutil
-
-            # Check if running as root/admin
-            if self.system_info.is_admin:
-                # Check if this specific process is running as admin
+            # Check if running as root. The is_admin gate predates the UID
+            # check and only saves the uids() call on user-mode scans (on
+            # Linux any user can read another process's UIDs). Windows has
+            # no UID to check; an elevated-token check would be needed there
+            if self.system_info.is_admin and not self.system_info.is_windows:
                 try:
-                    if self.system_info.is_windows:
-                        # On Windows, check if process has elevated privileges
-                        pass  # Would need Windows-specific check
-                    else:
-                        # On Unix, check if process UID is 0
-                        if proc.uids().real == 0:
-                            self._add_root_process_finding(proc)
+                    if proc.uids().real == 0:
+                        self._add_root_process_finding(proc)
                 except (AttributeError, psutil.AccessDenied):
                     pass
 
@@ -171,58 +224,28 @@ class ProcessMonitor(BaseScanner):
 
     def _check_cmdline_secrets(self, proc, cmdline: List[str]) -> None:
         """Check command line arguments for exposed secrets."""
-        import re
-
         cmdline_str = " ".join(cmdline)
 
-        # Patterns that might indicate secrets in cmdline
-        secret_patterns = [
-            (
-                r"--(?:api-?key|token|password|secret)[=\s]+([^\s]+)",
-                "API key/token in command line",
-            ),
-            (r"-p[=\s]+([^\s]+)", "Possible password in command line"),
-        ]
-
-        for pattern, description in secret_patterns:
-            matches = re.finditer(pattern, cmdline_str, re.IGNORECASE)
-            for match in matches:
-                finding = Finding(
-                    id="CLAWD-PROC-002",
-                    title="Potential Secret Exposed in Process Arguments",
-                    description=(
-                        "A potential secret was found in the command line "
-                        "arguments of the Clawdbot process. Command line "
-                        "arguments are visible to all users on the system "
-                        "through tools like 'ps' or Task Manager."
-                    ),
-                    severity=Severity.HIGH,
-                    category=Category.CREDENTIAL,
-                    cvss_score=7.5,
-                    evidence={
-                        "pid": proc.pid,
-                        "pattern_matched": description,
-                    },
-                    location=f"Process {proc.pid} command line",
-                    remediation=(
-                        "Move secrets to configuration files or environment variables "
-                        "instead of command line arguments."
-                    ),
-                    remediation_steps=[
-                        "Stop the Clawdbot process",
-                        "Move the secret to a configuration file",
-                        "Or use environment variables (less secure but better than cmdline)",
-                        "Restart Moltbot/Clawdbot without the secret in arguments",
-                    ],
-                    reference_links=[
-                        "https://www.netmeister.org/blog/passing-passwords.html",
-                    ],
-                    fix_prompt=(
-                        "Remove the secret from command line arguments and move it to a "
-                        "configuration file instead. Stop the process, add the secret to "
-                        "moltbot.json or clawdbot.json (e.g., '\"authToken\": \"<secret>\"'), "
-                        "set file permissions to 600, and restart the service without "
-                        "passing secrets via command line flags."
-                    ),
-                )
-                self.findings.append(finding)
+        # Every secret pattern starts with a dash, so skip the regex when the
+        # command line has no flags at all
+        if "-" not in cmdline_str:
+            return
+
+        # Report each process once, listing every kind of secret that matched
+        patterns_matched = list(
+            dict.fromkeys(
+                _SECRET_DESCRIPTIONS[match.lastgroup]
+                for match in _SECRET_PATTERN.finditer(cmdline_str)
+            )
+        )
+        if not patterns_matched:
+            return
+
+        finding = _CMDLINE_SECRET_FINDING.copy_with(
+            evidence={
+                "pid": proc.pid,
+                "patterns_matched": patterns_matched,
+            },
+            location=f"Process {proc.pid} command line",
+        )
+        self.findings.append(finding)
@@ -2,7 +2,8 @@
 Command-line interface for displaying scan results.
 """
 
-from typing import List
+import io
+from typing import Dict, List, Optional, Tuple
 
 from clawd_for_dummies.models.finding import Finding, Severity
 from clawd_for_dummies.models.scan_result import ScanResult
@@ -10,32 +11,85 @@ from clawd_for_dummies.models.scan_result import ScanResult
 # Priority finding ID - this finding should be displayed first prominently
 PRIORITY_FINDING_ID = "CLAWD-INSTALL-001"
 
+# ANSI escape codes
+_ANSI_RED = "\033[91m"
+_ANSI_ORANGE = "\033[38;5;208m"
+_ANSI_YELLOW = "\033[93m"
+_ANSI_GREEN = "\033[92m"
+_ANSI_BLUE = "\033[94m"
+_ANSI_WHITE = "\033[97m"
+_ANSI_RESET = "\033[0m"
+_ANSI_BOLD = "\033[1m"
+
+_COLOR_MAP = {
+    "red": _ANSI_RED,
+    "orange": _ANSI_ORANGE,
+    "yellow": _ANSI_YELLOW,
+    "green": _ANSI_GREEN,
+    "blue": _ANSI_BLUE,
+    "white": _ANSI_WHITE,
+    "reset": _ANSI_RESET,
+    "bold": _ANSI_BOLD,
+}
+
+
+def _plain_text(text: str, color: str) -> str:
+    """colorize() stand-in for instances created with use_colors=False."""
+    return text
+
 
 class CLI:
     """Console output formatter for scan results."""
 
-    COLORS = {
-        "red": "\033[91m",
-        "orange": "\033[38;5;208m",
-        "yellow": "\033[93m",
-        "green": "\033[92m",
-        "blue": "\033[94m",
-        "white": "\033[97m",
-        "reset": "\033[0m",
-        "bold": "\033[1m",
-    }
+    COLORS = _COLOR_MAP
+
+    HEADER = """
++====================================================================+
+|           CLAWD FOR DUMMIES - Security Scan Results                |
++====================================================================+
+"""
+
+    # Priority banner geometry
+    # The banner is 70 characters wide total (including | delimiters)
+    # Inner width is 68 characters (70 - 2 for the | delimiters)
+    BANNER_INNER_WIDTH = 68
+    BANNER_BORDER = "+" + "=" * BANNER_INNER_WIDTH + "+"
+    BANNER_BLANK_ROW = "|" + " " * BANNER_INNER_WIDTH + "|"
+
+    # Findings sections in display order: (severity, heading, color)
+    SEVERITY_SECTIONS = (
+        (Severity.CRITICAL, "[!] CRITICAL ISSUES (Fix IMMEDIATELY):", "red"),
+        (Severity.HIGH, "[H] HIGH ISSUES (Fix within 24 hours):", "orange"),
+        (Severity.MEDIUM, "[M] MEDIUM ISSUES (Fix within 1 week):", "yellow"),
+        (Severity.LOW, "[L] LOW ISSUES (Fix when convenient):", "green"),
+        (Severity.INFO, "[I] INFORMATIONAL:", "blue"),
+    )
 
     def __init__(self, use_colors: bool = True):
         self.use_colors = use_colors
 
+        # Bold wrapping for the priority banner, which is joined directly
+        # rather than going through colorize() line by line
+        self._bold_open = _ANSI_BOLD if use_colors else ""
+        self._bold_close = _ANSI_RESET if use_colors else ""
+        self._banner_border = self._bold_open + self.BANNER_BORDER + self._bold_close
+        self._banner_blank_row = (
+            self._bold_open + self.BANNER_BLANK_ROW + self._bold_close
+        )
+
+        # The "not found" message is static, so it is built on first use
+        self._moltbot_not_found_message: Optional[str] = None
+
+        # Without colors (CI, logs) colorize() is a pass-through, so bind the
+        # plain version directly rather than testing use_colors on every call
+        if not use_colors:
+            self.colorize = _plain_text
+
     def colorize(self, text: str, color: str) -> str:
         if not self.use_colors:
             return text
 
-        color_code = self.COLORS.get(color, "")
-        reset_code = self.COLORS["reset"]
-
-        return f"{color_code}{text}{reset_code}"
+        return _COLOR_MAP.get(color, "") + text + _ANSI_RESET
 
     def _is_priority_finding(self, finding: Finding) -> bool:
         """Check if a finding is a priority finding that should be displayed first.
@@ -61,41 +115,51 @@ class CLI:
 
         return has_moltbot_context and is_installation_related
 
-    def _get_priority_findings(self, findings: List[Finding]) -> List[Finding]:
-        """Get all priority findings from the list."""
-        return [f for f in findings if self._is_priority_finding(f)]
+    def _partition_findings(
+        self, findings: List[Finding]
+    ) -> Tuple[List[Finding], Dict[Severity, List[Finding]]]:
+        """Split findings into priority findings and regular ones by severity.
 
-    def _get_regular_findings(self, findings: List[Finding]) -> List[Finding]:
-        """Get all non-priority findings from the list."""
-        return [f for f in findings if not self._is_priority_finding(f)]
+        Everything is sorted in a single pass, checking each finding once.
+        """
+        priority_findings: List[Finding] = []
+        regular_by_severity: Dict[Severity, List[Finding]] = {
+            severity: [] for severity in Severity
+        }
+
+        for finding in findings:
+            if self._is_priority_finding(finding):
+                priority_findings.append(finding)
+            else:
+                regular_by_severity[finding.severity].append(finding)
+
+        return priority_findings, regular_by_severity
 
     def _format_priority_finding(self, finding: Finding) -> str:
         """Format a priority finding with bold, prominent display."""
         lines = []
 
-        # Banner width constants
-        # The banner is 70 characters wide total (including | delimiters)
-        # Inner width is 68 characters (70 - 2 for the | delimiters)
-        banner_inner_width = 68
         # Title prefix "     ⚠️  " is 9 characters (5 spaces + emoji + 2 spaces)
         # Note: emoji may render as 1-2 chars in different terminals
         title_prefix = "     ⚠️  "
         title_prefix_len = 9
         # Available width for title text = inner width - prefix length - 1 (closing |)
-        title_max_width = banner_inner_width - title_prefix_len - 1
+        title_max_width = self.BANNER_INNER_WIDTH - title_prefix_len - 1
 
         # Create a very visible, bold banner
         lines.append("")
-        lines.append(self.colorize("+" + "=" * banner_inner_width + "+", "bold"))
-        lines.append(self.colorize("|" + " " * banner_inner_width + "|", "bold"))
+        lines.append(self._banner_border)
+        lines.append(self._banner_blank_row)
         lines.append(
-            self.colorize(
-                "|" + title_prefix + finding.title.upper().ljust(title_max_width) + "|",
-                "bold",
-            )
+            self._bold_open
+            + "|"
+            + title_prefix
+            + finding.title.upper().ljust(title_max_width)
+            + "|"
+            + self._bold_close
         )
-        lines.append(self.colorize("|" + " " * banner_inner_width + "|", "bold"))
-        lines.append(self.colorize("+" + "=" * banner_inner_width + "+", "bold"))
+        lines.append(self._banner_blank_row)
+        lines.append(self._banner_border)
         lines.append("")
 
         # Description
@@ -122,45 +186,44 @@ class CLI:
                 lines.append(f"      - {link}")
 
         lines.append("")
-        lines.append(self.colorize("+" + "=" * banner_inner_width + "+", "bold"))
+        lines.append(self._banner_border)
         lines.append("")
 
         return "\n".join(lines)
 
     def format_scan_result(self, result: ScanResult) -> str:
-        lines = []
+        # Sections are written straight into one buffer rather than collected
+        # and joined, so large reports aren't copied an extra time
+        buf = io.StringIO()
+        write = buf.write
 
-        lines.append(self._format_header())
-        lines.append("")
+        write(self._format_header())
+        write("\n\n")
 
-        lines.append(self._format_system_info(result.system_info))
-        lines.append("")
+        write(self._format_system_info(result.system_info))
+        write("\n\n")
 
-        lines.append(self._format_overall_risk(result))
-        lines.append("")
+        write(self._format_overall_risk(result))
+        write("\n\n")
 
         if result.findings:
-            lines.append(self._format_findings(result))
+            write(self._format_findings(result))
+            write("\n")
         else:
-            lines.append(
+            write(
                 self.colorize(
                     "[OK] No security issues found! Your system looks safe.",
                     "green",
                 )
             )
-            lines.append("")
+            write("\n\n")
 
-        lines.append(self._format_footer(result))
+        write(self._format_footer(result))
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _format_header(self) -> str:
-        header = """
-+====================================================================+
-|           CLAWD FOR DUMMIES - Security Scan Results                |
-+====================================================================+
-"""
-        return header
+        return self.HEADER
 
     def _format_system_info(self, system_info) -> str:
         lines = [
@@ -197,7 +260,9 @@ class CLI:
 
         # First, check for priority findings (like "Moltbot/Clawdbot Not Installed")
         # These should be displayed FIRST, prominently
-        priority_findings = self._get_priority_findings(result.findings)
+        priority_findings, regular_by_severity = self._partition_findings(
+            result.findings
+        )
 
         if priority_findings:
             for finding in priority_findings:
@@ -211,59 +276,23 @@ class CLI:
         lines.append(f"   Info:     {result.info_count}")
         lines.append("")
 
-        # Get regular (non-priority) findings for each severity level
-        regular_findings = self._get_regular_findings(result.findings)
-
-        critical_findings = [f for f in regular_findings if f.severity == Severity.CRITICAL]
-        high_findings = [f for f in regular_findings if f.severity == Severity.HIGH]
-        medium_findings = [f for f in regular_findings if f.severity == Severity.MEDIUM]
-        low_findings = [f for f in regular_findings if f.severity == Severity.LOW]
-        info_findings = [f for f in regular_findings if f.severity == Severity.INFO]
-
-        if critical_findings:
-            lines.append(self.colorize("[!] CRITICAL ISSUES (Fix IMMEDIATELY):", "red"))
-            lines.append("")
-            for finding in critical_findings:
-                lines.append(self._format_finding(finding))
-            lines.append("")
-
-        if high_findings:
-            lines.append(
-                self.colorize("[H] HIGH ISSUES (Fix within 24 hours):", "orange")
-            )
-            lines.append("")
-            for finding in high_findings:
-                lines.append(self._format_finding(finding))
-            lines.append("")
-
-        if medium_findings:
-            lines.append(
-                self.colorize("[M] MEDIUM ISSUES (Fix within 1 week):", "yellow")
-            )
-            lines.append("")
-            for finding in medium_findings:
-                lines.append(self._format_finding(finding))
-            lines.append("")
-
-        if low_findings:
-            lines.append(self.colorize("[L] LOW ISSUES (Fix when convenient):", "green"))
-            lines.append("")
-            for finding in low_findings:
-                lines.append(self._format_finding(finding))
-            lines.append("")
+        # Regular (non-priority) findings, one section per severity level
+        for severity, heading, color in self.SEVERITY_SECTIONS:
+            severity_findings = regular_by_severity[severity]
+            if not severity_findings:
+                continue
 
-        if info_findings:
-            lines.append(self.colorize("[I] INFORMATIONAL:", "blue"))
+            lines.append(self.colorize(heading, color))
             lines.append("")
-            for finding in info_findings:
-                lines.append(self._format_finding(finding))
+            lines.extend(self._format_finding(finding) for finding in severity_findings)
             lines.append("")
 
         return "\n".join(lines)
 
     def _format_finding(self, finding: Finding) -> str:
-        color = finding.severity.color
-        indicator = finding.severity.indicator
+        severity = finding.severity
+        color = severity.color
+        indicator = severity.indicator
 
         lines = [
             self.colorize(f"{indicator} {finding.title}", color),
@@ -279,14 +308,15 @@ class CLI:
             lines.append(f"   {finding.remediation}")
 
         if finding.remediation_steps:
-            for i, step in enumerate(finding.remediation_steps, 1):
-                lines.append(f"      {i}. {step}")
+            lines.extend(
+                f"      {i}. {step}"
+                for i, step in enumerate(finding.remediation_steps, 1)
+            )
 
         if finding.reference_links:
             lines.append("")
             lines.append("   Learn more:")
-            for link in finding.reference_links:
-                lines.append(f"      - {link}")
+            lines.extend("      - " + link for link in finding.reference_links)
 
         lines.append("")
 
@@ -307,6 +337,11 @@ class CLI:
 
     def format_moltbot_not_found_message(self) -> str:
         """Format a user-friendly message when Moltbot is not installed/running."""
+        if self._moltbot_not_found_message is None:
+            self._moltbot_not_found_message = self._build_moltbot_not_found_message()
+        return self._moltbot_not_found_message
+
+    def _build_moltbot_not_found_message(self) -> str:
         lines = []
         lines.append("")
         lines.append(self.colorize("╔═══════════════════════════════════════════════════════════════╗", "yellow"))
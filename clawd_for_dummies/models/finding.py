@@ -2,11 +2,18 @@
 Finding model for security vulnerabilities and their attributes.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List
 
+# Drop the per-instance __dict__ from the model dataclasses where the running
+# Python supports slotted dataclasses (3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 class Severity(Enum):
     """Severity levels for security findings."""
@@ -22,36 +29,42 @@ class Severity(Enum):
 
     @property
     def color(self) -> str:
-        colors = {
-            Severity.CRITICAL: "red",
-            Severity.HIGH: "orange",
-            Severity.MEDIUM: "yellow",
-            Severity.LOW: "green",
-            Severity.INFO: "blue",
-        }
-        return colors.get(self, "white")
+        return _SEVERITY_COLORS.get(self, "white")
 
     @property
     def indicator(self) -> str:
-        indicators = {
-            Severity.CRITICAL: "[!]",
-            Severity.HIGH: "[H]",
-            Severity.MEDIUM: "[M]",
-            Severity.LOW: "[L]",
-            Severity.INFO: "[I]",
-        }
-        return indicators.get(self, "[?]")
+        return _SEVERITY_INDICATORS.get(self, "[?]")
 
     @property
     def description(self) -> str:
-        descriptions = {
-            Severity.CRITICAL: "Fix IMMEDIATELY - System is compromised",
-            Severity.HIGH: "Fix within 24 hours - Serious risk",
-            Severity.MEDIUM: "Fix within 1 week - Moderate risk",
-            Severity.LOW: "Fix when convenient - Minor issue",
-            Severity.INFO: "Informational - No action needed",
-        }
-        return descriptions.get(self, "Unknown severity")
+        return _SEVERITY_DESCRIPTIONS.get(self, "Unknown severity")
+
+
+# Per-severity display attributes, built once rather than on every property
+# access (the report formatters read these for each finding)
+_SEVERITY_COLORS = {
+    Severity.CRITICAL: "red",
+    Severity.HIGH: "orange",
+    Severity.MEDIUM: "yellow",
+    Severity.LOW: "green",
+    Severity.INFO: "blue",
+}
+
+_SEVERITY_INDICATORS = {
+    Severity.CRITICAL: "[!]",
+    Severity.HIGH: "[H]",
+    Severity.MEDIUM: "[M]",
+    Severity.LOW: "[L]",
+    Severity.INFO: "[I]",
+}
+
+_SEVERITY_DESCRIPTIONS = {
+    Severity.CRITICAL: "Fix IMMEDIATELY - System is compromised",
+    Severity.HIGH: "Fix within 24 hours - Serious risk",
+    Severity.MEDIUM: "Fix within 1 week - Moderate risk",
+    Severity.LOW: "Fix when convenient - Minor issue",
+    Severity.INFO: "Informational - No action needed",
+}
 
 
 class Category(Enum):
@@ -77,26 +90,41 @@ class Category(Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            Category.PORT: "Port Exposure",
-            Category.CREDENTIAL: "Credential Exposure",
-            Category.CONFIG: "Configuration Issue",
-            Category.PROCESS: "Process Security",
-            Category.PERMISSION: "File Permission",
-            Category.NETWORK: "Network Exposure",
-            Category.AUTHENTICATION: "Authentication",
-            Category.ENCRYPTION: "Encryption",
-            Category.LOGGING: "Logging",
-            Category.SANDBOX: "Sandbox Security",
-            Category.COMMAND_INJECTION: "Command Injection",
-            Category.ACCESS_CONTROL: "Access Control",
-            Category.PROMPT_INJECTION: "Prompt Injection",
-            Category.OTHER: "Other",
-        }
-        return names.get(self, "Unknown")
+        return _CATEGORY_NAMES.get(self, "Unknown")
+
 
+_CATEGORY_NAMES = {
+    Category.PORT: "Port Exposure",
+    Category.CREDENTIAL: "Credential Exposure",
+    Category.CONFIG: "Configuration Issue",
+    Category.PROCESS: "Process Security",
+    Category.PERMISSION: "File Permission",
+    Category.NETWORK: "Network Exposure",
+    Category.AUTHENTICATION: "Authentication",
+    Category.ENCRYPTION: "Encryption",
+    Category.LOGGING: "Logging",
+    Category.SANDBOX: "Sandbox Security",
+    Category.COMMAND_INJECTION: "Command Injection",
+    Category.ACCESS_CONTROL: "Access Control",
+    Category.PROMPT_INJECTION: "Prompt Injection",
+    Category.OTHER: "Other",
+}
 
-@dataclass
+
+# Value -> member maps for deserialization; unknown values fall back to the
+# Enum constructor so they still raise ValueError
+_SEVERITY_BY_VALUE = {member.value: member for member in Severity}
+_CATEGORY_BY_VALUE = {member.value: member for member in Category}
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an ISO timestamp, passing through values that are already datetimes."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Finding:
     """Represents a security finding or vulnerability."""
 
@@ -125,16 +153,29 @@ class Finding:
 
     @property
     def is_critical(self) -> bool:
-        return self.severity == Severity.CRITICAL
+        return self.severity is Severity.CRITICAL
 
     @property
     def is_high(self) -> bool:
-        return self.severity == Severity.HIGH
+        return self.severity is Severity.HIGH
 
     @property
     def requires_immediate_action(self) -> bool:
         return self.severity in (Severity.CRITICAL, Severity.HIGH)
 
+    def copy_with(self, **changes: Any) -> "Finding":
+        """Return a copy of this finding with the given fields replaced.
+
+        Scanners use this to stamp out findings from module-level templates,
+        so the copy gets a fresh timestamp and its own evidence/list objects
+        unless those are passed in explicitly.
+        """
+        changes.setdefault("timestamp", datetime.now())
+        changes.setdefault("evidence", dict(self.evidence))
+        changes.setdefault("remediation_steps", list(self.remediation_steps))
+        changes.setdefault("reference_links", list(self.reference_links))
+        return replace(self, **changes)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -154,23 +195,39 @@ class Finding:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Finding":
-        return cls(
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> "Finding":
+        """Create a finding from a dictionary produced by ``to_dict``.
+
+        Pass ``validate=False`` for trusted data, such as a report this tool
+        saved itself, to skip the ``__post_init__`` checks.
+        """
+        fields = dict(
             id=data["id"],
             title=data["title"],
             description=data["description"],
-            severity=Severity(data["severity"]),
-            category=Category(data["category"]),
+            severity=(
+                _SEVERITY_BY_VALUE.get(data["severity"]) or Severity(data["severity"])
+            ),
+            category=(
+                _CATEGORY_BY_VALUE.get(data["category"]) or Category(data["category"])
+            ),
             cvss_score=data.get("cvss_score", 0.0),
             evidence=data.get("evidence", {}),
             location=data.get("location", ""),
             remediation=data.get("remediation", ""),
             remediation_steps=data.get("remediation_steps", []),
             reference_links=data.get("reference_links", []),
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=_parse_timestamp(data["timestamp"]),
             scanner_version=data.get("scanner_version", "1.0.0"),
             fix_prompt=data.get("fix_prompt", ""),
         )
+        if validate:
+            return cls(**fields)
+
+        finding = object.__new__(cls)
+        for name, value in fields.items():
+            object.__setattr__(finding, name, value)
+        return finding
 
     def format_for_console(self) -> str:
         lines = [
@@ -2,12 +2,18 @@
 Scan result model for aggregating security scan findings.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Any
 
-from clawd_for_dummies.models.finding import Finding, Severity
+from clawd_for_dummies.models.finding import (
+    _DATACLASS_OPTIONS,
+    Finding,
+    Severity,
+    _parse_timestamp,
+)
 from clawd_for_dummies.models.system_info import SystemInfo
 
 
@@ -25,41 +31,54 @@ class RiskLevel(Enum):
 
     @property
     def color(self) -> str:
-        colors = {
-            RiskLevel.CRITICAL: "red",
-            RiskLevel.HIGH: "orange",
-            RiskLevel.MEDIUM: "yellow",
-            RiskLevel.LOW: "green",
-            RiskLevel.SAFE: "blue",
-        }
-        return colors.get(self, "white")
+        return _RISK_LEVEL_COLORS.get(self, "white")
 
     @property
     def indicator(self) -> str:
-        indicators = {
-            RiskLevel.CRITICAL: "[!]",
-            RiskLevel.HIGH: "[H]",
-            RiskLevel.MEDIUM: "[M]",
-            RiskLevel.LOW: "[L]",
-            RiskLevel.SAFE: "[OK]",
-        }
-        return indicators.get(self, "[?]")
+        return _RISK_LEVEL_INDICATORS.get(self, "[?]")
 
     @property
     def message(self) -> str:
-        messages = {
-            RiskLevel.CRITICAL: "CRITICAL RISK - Immediate action required!",
-            RiskLevel.HIGH: "HIGH RISK - Fix within 24 hours",
-            RiskLevel.MEDIUM: "MEDIUM RISK - Fix within 1 week",
-            RiskLevel.LOW: "LOW RISK - Minor issues found",
-            RiskLevel.SAFE: "SAFE - No significant issues found",
-        }
-        return messages.get(self, "Unknown risk level")
-
-
-@dataclass
+        return _RISK_LEVEL_MESSAGES.get(self, "Unknown risk level")
+
+
+# Per-level display attributes, built once rather than on every property access
+_RISK_LEVEL_COLORS = {
+    RiskLevel.CRITICAL: "red",
+    RiskLevel.HIGH: "orange",
+    RiskLevel.MEDIUM: "yellow",
+    RiskLevel.LOW: "green",
+    RiskLevel.SAFE: "blue",
+}
+
+_RISK_LEVEL_INDICATORS = {
+    RiskLevel.CRITICAL: "[!]",
+    RiskLevel.HIGH: "[H]",
+    RiskLevel.MEDIUM: "[M]",
+    RiskLevel.LOW: "[L]",
+    RiskLevel.SAFE: "[OK]",
+}
+
+_RISK_LEVEL_MESSAGES = {
+    RiskLevel.CRITICAL: "CRITICAL RISK - Immediate action required!",
+    RiskLevel.HIGH: "HIGH RISK - Fix within 24 hours",
+    RiskLevel.MEDIUM: "MEDIUM RISK - Fix within 1 week",
+    RiskLevel.LOW: "LOW RISK - Minor issues found",
+    RiskLevel.SAFE: "SAFE - No significant issues found",
+}
+
+# Value -> member map for deserialization; unknown values fall back to the
+# Enum constructor so they still raise ValueError
+_RISK_LEVEL_BY_VALUE = {member.value: member for member in RiskLevel}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ScanResult:
-    """Represents the complete result of a security scan."""
+    """Represents the complete result of a security scan.
+
+    Severity counts and immediate actions are tallied once when the result
+    is created, so ``findings`` should not be modified afterwards.
+    """
 
     scan_id: str
     timestamp: datetime
@@ -69,21 +88,46 @@ class ScanResult:
     overall_risk_score: float = 0.0
     risk_level: RiskLevel = RiskLevel.SAFE
     scanner_version: str = "1.0.0"
+    _severity_counts: Counter = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _immediate_actions: List[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         self._calculate_summary()
 
     def _calculate_summary(self) -> None:
+        # Gather scores, severity counts and immediate actions in one pass
+        severity_counts: Counter = Counter()
+        immediate_actions: List[str] = []
+        max_score = 0.0
+        total_score = 0.0
+
+        for finding in self.findings:
+            score = finding.cvss_score
+            total_score += score
+            if score > max_score:
+                max_score = score
+
+            severity = finding.severity
+            severity_counts[severity] += 1
+            if severity is Severity.CRITICAL or severity is Severity.HIGH:
+                immediate_actions.append(finding.title)
+
+        self._severity_counts = severity_counts
+        self._immediate_actions = immediate_actions
+
         if not self.findings:
             self.overall_risk_score = 0.0
             self.risk_level = RiskLevel.SAFE
             return
 
-        max_score = max(f.cvss_score for f in self.findings)
-        avg_score = sum(f.cvss_score for f in self.findings) / len(self.findings)
+        avg_score = total_score / len(self.findings)
 
-        critical_count = self.critical_count
-        high_count = self.high_count
+        critical_count = severity_counts[Severity.CRITICAL]
+        high_count = severity_counts[Severity.HIGH]
 
         self.overall_risk_score = min(
             max_score * 0.6 + avg_score * 0.2 + (critical_count * 2 + high_count) * 0.2,
@@ -103,23 +147,23 @@ class ScanResult:
 
     @property
     def critical_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == Severity.CRITICAL)
+        return self._severity_counts[Severity.CRITICAL]
 
     @property
     def high_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == Severity.HIGH)
+        return self._severity_counts[Severity.HIGH]
 
     @property
     def medium_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == Severity.MEDIUM)
+        return self._severity_counts[Severity.MEDIUM]
 
     @property
     def low_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == Severity.LOW)
+        return self._severity_counts[Severity.LOW]
 
     @property
     def info_count(self) -> int:
-        return sum(1 for f in self.findings if f.severity == Severity.INFO)
+        return self._severity_counts[Severity.INFO]
 
     @property
     def total_count(self) -> int:
@@ -127,14 +171,10 @@ class ScanResult:
 
     @property
     def immediate_actions(self) -> List[str]:
-        actions = []
-        for finding in self.findings:
-            if finding.requires_immediate_action:
-                actions.append(finding.title)
-        return actions
+        return list(self._immediate_actions)
 
     def get_findings_by_severity(self, severity: Severity) -> List[Finding]:
-        return [f for f in self.findings if f.severity == severity]
+        return [f for f in self.findings if f.severity is severity]
 
     def get_critical_findings(self) -> List[Finding]:
         return self.get_findings_by_severity(Severity.CRITICAL)
@@ -167,20 +207,25 @@ class ScanResult:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ScanResult":
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> "ScanResult":
         from clawd_for_dummies.models.system_info import SystemInfo
 
-        findings = [Finding.from_dict(f) for f in data.get("findings", [])]
+        findings = [
+            Finding.from_dict(f, validate=validate) for f in data.get("findings", [])
+        ]
+        risk_level_value = data.get("risk_level", "safe")
         system_info = SystemInfo.from_dict(data.get("system_info", {}))
 
         return cls(
             scan_id=data["scan_id"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
+            timestamp=_parse_timestamp(data["timestamp"]),
             duration_seconds=data["duration_seconds"],
             system_info=system_info,
             findings=findings,
             overall_risk_score=data.get("overall_risk_score", 0.0),
-            risk_level=RiskLevel(data.get("risk_level", "safe")),
+            risk_level=(
+                _RISK_LEVEL_BY_VALUE.get(risk_level_value) or RiskLevel(risk_level_value)
+            ),
             scanner_version=data.get("scanner_version", "1.0.0"),
         )
 
@@ -2,15 +2,29 @@
 System information model for collecting host environment details.
 """
 
+import getpass
+import os
 import platform
 import socket
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
+try:
+    import psutil
+except ImportError:  # Interface addresses are skipped if psutil is missing
+    psutil = None
 
-@dataclass
+from clawd_for_dummies.models.finding import _DATACLASS_OPTIONS
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemInfo:
-    """System information collected during security scans."""
+    """System information collected during security scans.
+
+    This is a plain container; use ``collect()`` to populate it from the
+    current host.
+    """
 
     hostname: str = ""
     os_name: str = ""
@@ -27,22 +41,6 @@ class SystemInfo:
     local_ips: List[str] = field(default_factory=list)
     network_interfaces: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if not self.hostname:
-            self.hostname = socket.gethostname()
-        if not self.os_name:
-            self.os_name = platform.system()
-        if not self.os_version:
-            self.os_version = platform.version()
-        if not self.os_release:
-            self.os_release = platform.release()
-        if not self.architecture:
-            self.architecture = platform.machine()
-        if not self.processor:
-            self.processor = platform.processor()
-        if not self.python_version:
-            self.python_version = platform.python_version()
-
     @property
     def is_windows(self) -> bool:
         return self.os_name.lower() == "windows"
@@ -105,11 +103,29 @@ class SystemInfo:
 
     @classmethod
     def collect(cls) -> "SystemInfo":
-        """Collect system information from the current system."""
-        import getpass
-        import os
+        """Collect system information from the current system.
+
+        The host details don't change while the process runs, so they are
+        gathered once and each call returns a fresh copy of the cached result.
+        """
+        info = _collect_system_info(cls)
+        return replace(
+            info,
+            local_ips=list(info.local_ips),
+            network_interfaces=dict(info.network_interfaces),
+        )
 
-        info = cls()
+    @classmethod
+    def _collect_uncached(cls) -> "SystemInfo":
+        info = cls(
+            hostname=socket.gethostname(),
+            os_name=platform.system(),
+            os_version=platform.version(),
+            os_release=platform.release(),
+            architecture=platform.machine(),
+            processor=platform.processor(),
+            python_version=platform.python_version(),
+        )
 
         try:
             info.username = getpass.getuser()
@@ -124,9 +140,8 @@ class SystemInfo:
         return info
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _check_admin_privileges() -> bool:
-        import os
-
         try:
             if os.name == "nt":
                 import ctypes
@@ -138,29 +153,28 @@ class SystemInfo:
 
     @staticmethod
     def _get_local_ips() -> List[str]:
-        import socket
-
+        # Deduplicate while collecting, keeping discovery order
         ips = []
+        seen = set()
         try:
             hostname = socket.gethostname()
             ip = socket.gethostbyname(hostname)
             if ip and ip != "127.0.0.1":
                 ips.append(ip)
+                seen.add(ip)
         except Exception:
             pass
 
-        try:
-            import psutil
+        if psutil is not None:
             for interface, addrs in psutil.net_if_addrs().items():
                 for addr in addrs:
                     if addr.family == socket.AF_INET:
                         ip = addr.address
-                        if ip and not ip.startswith("127."):
+                        if ip and ip not in seen and not ip.startswith("127."):
                             ips.append(ip)
-        except ImportError:
-            pass
+                            seen.add(ip)
 
-        return list(set(ips))
+        return ips
 
     def format_for_report(self) -> str:
         lines = [
@@ -180,3 +194,8 @@ class SystemInfo:
             lines.append(f"  Public IP: {self.public_ip}")
 
         return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _collect_system_info(cls: type) -> SystemInfo:
+    return cls._collect_uncached()
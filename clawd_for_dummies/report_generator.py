@@ -5,81 +5,78 @@ Report generator for HTML, JSON, and Markdown output formats.
 import html as html_escape
 import json
 
-from clawd_for_dummies.models.scan_result import ScanResult
-
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib encoder is used without it
+    orjson = None
 
-class ReportGenerator:
-    """Generates security scan reports in various formats."""
+from clawd_for_dummies.models.scan_result import ScanResult
 
-    def generate_html(self, result: ScanResult) -> str:
-        """
-        Generate an HTML report from scan results. This method creates a complete
-        HTML document with inline CSS styling for the security report.
-        """
-        html = f"""<!DOCTYPE html>
+# Static document head and stylesheet, shared by every HTML report
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>ClawdForDummies Security Report</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             max-width: 900px;
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 20px;
-        }}
-        .risk-meter {{
+        }
+        .risk-meter {
             text-align: center;
             padding: 20px;
             border-radius: 10px;
             margin: 20px 0;
-        }}
-        .risk-critical {{ background-color: #fee; border: 2px solid #c00; }}
-        .risk-high {{ background-color: #fff3cd; border: 2px solid #f0ad4e; }}
-        .risk-medium {{ background-color: #fffbe6; border: 2px solid #ffc107; }}
-        .risk-low {{ background-color: #d4edda; border: 2px solid #28a745; }}
-        .risk-safe {{ background-color: #d1ecf1; border: 2px solid #17a2b8; }}
-        .finding {{
+        }
+        .risk-critical { background-color: #fee; border: 2px solid #c00; }
+        .risk-high { background-color: #fff3cd; border: 2px solid #f0ad4e; }
+        .risk-medium { background-color: #fffbe6; border: 2px solid #ffc107; }
+        .risk-low { background-color: #d4edda; border: 2px solid #28a745; }
+        .risk-safe { background-color: #d1ecf1; border: 2px solid #17a2b8; }
+        .finding {
             background: white;
             padding: 20px;
             margin: 10px 0;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .finding-critical {{ border-left: 4px solid #dc3545; }}
-        .finding-high {{ border-left: 4px solid #fd7e14; }}
-        .finding-medium {{ border-left: 4px solid #ffc107; }}
-        .finding-low {{ border-left: 4px solid #28a745; }}
-        .finding-info {{ border-left: 4px solid #6c757d; }}
-        .severity {{
+        }
+        .finding-critical { border-left: 4px solid #dc3545; }
+        .finding-high { border-left: 4px solid #fd7e14; }
+        .finding-medium { border-left: 4px solid #ffc107; }
+        .finding-low { border-left: 4px solid #28a745; }
+        .finding-info { border-left: 4px solid #6c757d; }
+        .severity {
             display: inline-block;
             padding: 4px 12px;
             border-radius: 4px;
             font-weight: bold;
             font-size: 12px;
             text-transform: uppercase;
-        }}
-        .severity-critical {{ background: #dc3545; color: white; }}
-        .severity-high {{ background: #fd7e14; color: white; }}
-        .severity-medium {{ background: #ffc107; color: black; }}
-        .severity-low {{ background: #28a745; color: white; }}
-        .severity-info {{ background: #6c757d; color: white; }}
-        .remediation {{
+        }
+        .severity-critical { background: #dc3545; color: white; }
+        .severity-high { background: #fd7e14; color: white; }
+        .severity-medium { background: #ffc107; color: black; }
+        .severity-low { background: #28a745; color: white; }
+        .severity-info { background: #6c757d; color: white; }
+        .remediation {
             background: #f8f9fa;
             padding: 15px;
             border-radius: 5px;
             margin-top: 10px;
-        }}
-        .fix-prompt {{
+        }
+        .fix-prompt {
             background: #1e1e1e;
             color: #d4d4d4;
             padding: 15px;
@@ -91,147 +88,145 @@ class ReportGenerator:
             white-space: pre-wrap;
             word-wrap: break-word;
             position: relative;
-        }}
-        .fix-prompt-header {{
+        }
+        .fix-prompt-header {
             color: #667eea;
             font-weight: bold;
             margin-bottom: 8px;
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-        }}
-        .summary {{
+        }
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
             gap: 10px;
             margin: 20px 0;
-        }}
-        .summary-item {{
+        }
+        .summary-item {
             text-align: center;
             padding: 15px;
             border-radius: 8px;
             background: white;
-        }}
-        .summary-count {{
+        }
+        .summary-count {
             font-size: 32px;
             font-weight: bold;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             padding: 20px;
             color: #666;
             font-size: 14px;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
+"""
+
+# Report header, risk meter and severity summary
+_HTML_SUMMARY = """    <div class="header">
         <h1>ClawdForDummies Security Report</h1>
-        <p>Generated on: {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p>Scan ID: {result.scan_id}</p>
+        <p>Generated on: {timestamp}</p>
+        <p>Scan ID: {scan_id}</p>
     </div>
 
-    <div class="risk-meter risk-{result.risk_level.value}">
-        <h2>Overall Risk: {result.risk_level.value.upper()}</h2>
-        <p style="font-size: 48px; margin: 10px 0;">{result.risk_level.indicator}</p>
-        <p>Risk Score: {result.overall_risk_score:.1f}/10</p>
-        <p>{result.risk_level.message}</p>
+    <div class="risk-meter risk-{risk_level}">
+        <h2>Overall Risk: {risk_level_label}</h2>
+        <p style="font-size: 48px; margin: 10px 0;">{risk_indicator}</p>
+        <p>Risk Score: {risk_score:.1f}/10</p>
+        <p>{risk_message}</p>
     </div>
 
     <div class="summary">
         <div class="summary-item">
-            <div class="summary-count" style="color: #dc3545;">{result.critical_count}</div>
+            <div class="summary-count" style="color: #dc3545;">{critical_count}</div>
             <div>Critical</div>
         </div>
         <div class="summary-item">
-            <div class="summary-count" style="color: #fd7e14;">{result.high_count}</div>
+            <div class="summary-count" style="color: #fd7e14;">{high_count}</div>
             <div>High</div>
         </div>
         <div class="summary-item">
-            <div class="summary-count" style="color: #ffc107;">{result.medium_count}</div>
+            <div class="summary-count" style="color: #ffc107;">{medium_count}</div>
             <div>Medium</div>
         </div>
         <div class="summary-item">
-            <div class="summary-count" style="color: #28a745;">{result.low_count}</div>
+            <div class="summary-count" style="color: #28a745;">{low_count}</div>
             <div>Low</div>
         </div>
         <div class="summary-item">
-            <div class="summary-count" style="color: #6c757d;">{result.info_count}</div>
+            <div class="summary-count" style="color: #6c757d;">{info_count}</div>
             <div>Info</div>
         </div>
     </div>
 """
 
-        if result.findings:
-            html += "    <h2>Detailed Findings</h2>\n"
-
-            for finding in result.findings:
-                fix_prompt_html = ""
-                if finding.fix_prompt:
-                    # Escape HTML to prevent XSS
-                    escaped_prompt = html_escape.escape(finding.fix_prompt)
-                    fix_prompt_html = f'''
-        <div class="fix-prompt" role="region" aria-label="AI Fix Prompt">
-            <h5 class="fix-prompt-header">AI Fix Prompt (copy and paste to your AI assistant)</h5>
-            {escaped_prompt}
-        </div>'''
-
-                html += f"""
-    <div class="finding finding-{finding.severity.value}">
-        <span class="severity severity-{finding.severity.value}">{finding.severity.value.upper()}</span>
-        <h3>{html_escape.escape(finding.title)}</h3>
-        <p><strong>Category:</strong> {html_escape.escape(finding.category.display_name)}</p>
-        <p>{html_escape.escape(finding.description)}</p>
+# Per-finding HTML fragments, formatted with already-escaped values
+_FINDING_HTML = """
+    <div class="finding finding-{severity}">
+        <span class="severity severity-{severity}">{severity_label}</span>
+        <h3>{title}</h3>
+        <p><strong>Category:</strong> {category}</p>
+        <p>{description}</p>
 
-        {f'<p><strong>Location:</strong> {html_escape.escape(finding.location)}</p>' if finding.location else ''}
+        {location_html}
 
         <div class="remediation">
             <h4>How to Fix</h4>
-            <p>{html_escape.escape(finding.remediation)}</p>
+            <p>{remediation}</p>
 
-            {f'<ol>{"".join(f"<li>{html_escape.escape(step)}</li>" for step in finding.remediation_steps)}</ol>' if finding.remediation_steps else ''}
+            {steps_html}
         </div>
 
         {fix_prompt_html}
 
-        {f'<p><strong>Learn more:</strong> {" | ".join(f"<a href=\"{html_escape.escape(link)}\">{html_escape.escape(link)}</a>" for link in finding.reference_links)}</p>' if finding.reference_links else ''}
-    </div>
-"""
-        else:
-            html += """
-    <div class="finding" style="text-align: center;">
-        <h2>No Security Issues Found!</h2>
-        <p>Your system looks safe. No vulnerabilities were detected.</p>
+        {links_html}
     </div>
 """
 
-        html += f"""
+_LOCATION_HTML = "<p><strong>Location:</strong> {location}</p>"
+
+_STEP_HTML = "<li>{step}</li>"
+
+_LINK_HTML = '<a href="{link}">{link}</a>'
+
+_FIX_PROMPT_HTML = """
+        <div class="fix-prompt" role="region" aria-label="AI Fix Prompt">
+            <h5 class="fix-prompt-header">AI Fix Prompt (copy and paste to your AI assistant)</h5>
+            {fix_prompt}
+        </div>"""
+
+_HTML_FOOTER = """
     <div class="footer">
-        <p>Scan completed in {result.duration_seconds:.2f} seconds</p>
-        <p>Scanner version: {result.scanner_version}</p>
+        <p>Scan completed in {duration:.2f} seconds</p>
+        <p>Scanner version: {scanner_version}</p>
         <p>For more information: <a href="https://github.com/yourusername/clawd-for-dummies">ClawdForDummies on GitHub</a></p>
     </div>
 </body>
 </html>
 """
 
-        return html
+_NO_FINDINGS_HTML = """
+    <div class="finding" style="text-align: center;">
+        <h2>No Security Issues Found!</h2>
+        <p>Your system looks safe. No vulnerabilities were detected.</p>
+    </div>
+"""
 
-    def generate_json(self, result: ScanResult) -> str:
-        return json.dumps(result.to_dict(), indent=2)
 
-    def generate_markdown(self, result: ScanResult) -> str:
-        md = f"""# ClawdForDummies Security Report
+# Markdown report sections, filled in with str.format
+_MD_HEADER = """# ClawdForDummies Security Report
 
-**Generated:** {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
-**Scan ID:** {result.scan_id}
-**Scanner Version:** {result.scanner_version}
+**Generated:** {timestamp}
+**Scan ID:** {scan_id}
+**Scanner Version:** {scanner_version}
 
 ---
 
-## Overall Risk: {result.risk_level.value.upper()} {result.risk_level.indicator}
+## Overall Risk: {risk_level_label} {risk_indicator}
 
-**Risk Score:** {result.overall_risk_score:.1f}/10
+**Risk Score:** {risk_score:.1f}/10
 
-{result.risk_level.message}
+{risk_message}
 
 ---
 
@@ -239,70 +234,219 @@ class ReportGenerator:
 
 | Severity | Count |
 |----------|-------|
-| Critical | {result.critical_count} |
-| High | {result.high_count} |
-| Medium | {result.medium_count} |
-| Low | {result.low_count} |
-| Info | {result.info_count} |
-| **Total** | **{result.total_count}** |
+| Critical | {critical_count} |
+| High | {high_count} |
+| Medium | {medium_count} |
+| Low | {low_count} |
+| Info | {info_count} |
+| **Total** | **{total_count}** |
 
 ---
 
 """
 
-        if result.findings:
-            md += "## Detailed Findings\n\n"
-
-            for finding in result.findings:
-                md += f"""### {finding.severity.indicator} {finding.title}
+_MD_FINDING = """### {indicator} {title}
 
-**Severity:** {finding.severity.value.upper()}
-**Category:** {finding.category.display_name}
-**Risk Score:** {finding.cvss_score}/10
+**Severity:** {severity_label}
+**Category:** {category}
+**Risk Score:** {cvss_score}/10
 
-{f"**Location:** {finding.location}  " if finding.location else ""}
+{location_line}
 
-{finding.description}
+{description}
 
 #### Remediation
 
-{finding.remediation}
+{remediation}
 
 """
 
+_MD_NO_FINDINGS = """## No Security Issues Found
+
+Your system looks safe. No vulnerabilities were detected.
+
+---
+
+"""
+
+_MD_FOOTER = """## Scan Details
+
+- **Duration:** {duration:.2f} seconds
+- **Scanner Version:** {scanner_version}
+
+For more information, visit: https://github.com/yourusername/clawd-for-dummies
+"""
+
+
+class ReportGenerator:
+    """Generates security scan reports in various formats."""
+
+    def generate_html(self, result: ScanResult) -> str:
+        """
+        Generate an HTML report from scan results. This method creates a complete
+        HTML document with inline CSS styling for the security report.
+        """
+        risk_level = result.risk_level
+        parts = [
+            _HTML_HEAD,
+            _HTML_SUMMARY.format(
+                timestamp=result.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                scan_id=result.scan_id,
+                risk_level=risk_level.value,
+                risk_level_label=risk_level.value.upper(),
+                risk_indicator=risk_level.indicator,
+                risk_score=result.overall_risk_score,
+                risk_message=risk_level.message,
+                critical_count=result.critical_count,
+                high_count=result.high_count,
+                medium_count=result.medium_count,
+                low_count=result.low_count,
+                info_count=result.info_count,
+            ),
+        ]
+
+        if result.findings:
+            parts.append("    <h2>Detailed Findings</h2>\n")
+
+            esc = html_escape.escape
+            for finding in result.findings:
+                severity_value = finding.severity.value
+
+                location_html = ""
+                if finding.location:
+                    location_html = _LOCATION_HTML.format(location=esc(finding.location))
+
+                steps_html = ""
                 if finding.remediation_steps:
-                    md += "**Steps:**\n"
-                    for i, step in enumerate(finding.remediation_steps, 1):
-                        md += f"{i}. {step}\n"
-                    md += "\n"
+                    steps_html = "".join(
+                        _STEP_HTML.format(step=esc(step))
+                        for step in finding.remediation_steps
+                    )
+                    steps_html = f"<ol>{steps_html}</ol>"
 
+                fix_prompt_html = ""
                 if finding.fix_prompt:
-                    md += "#### AI Fix Prompt\n\n"
-                    md += "Copy and paste this prompt to your AI assistant:\n\n"
-                    md += f"```\n{finding.fix_prompt}\n```\n\n"
+                    # Escape HTML to prevent XSS
+                    fix_prompt_html = _FIX_PROMPT_HTML.format(
+                        fix_prompt=esc(finding.fix_prompt)
+                    )
 
+                links_html = ""
                 if finding.reference_links:
-                    md += "**References:**\n"
-                    for link in finding.reference_links:
-                        md += f"- {link}\n"
-                    md += "\n"
-
-                md += "---\n\n"
+                    links_html = " | ".join(
+                        _LINK_HTML.format(link=esc(link))
+                        for link in finding.reference_links
+                    )
+                    links_html = f"<p><strong>Learn more:</strong> {links_html}</p>"
+
+                parts.append(
+                    _FINDING_HTML.format(
+                        severity=severity_value,
+                        severity_label=severity_value.upper(),
+                        title=esc(finding.title),
+                        category=esc(finding.category.display_name),
+                        description=esc(finding.description),
+                        location_html=location_html,
+                        remediation=esc(finding.remediation),
+                        steps_html=steps_html,
+                        fix_prompt_html=fix_prompt_html,
+                        links_html=links_html,
+                    )
+                )
         else:
-            md += """## No Security Issues Found
+            parts.append(_NO_FINDINGS_HTML)
 
-Your system looks safe. No vulnerabilities were detected.
+        parts.append(
+            _HTML_FOOTER.format(
+                duration=result.duration_seconds,
+                scanner_version=result.scanner_version,
+            )
+        )
 
----
+        return "".join(parts)
 
-"""
+    def generate_json(self, result: ScanResult) -> str:
+        data = result.to_dict()
+        # orjson output decodes to the same data as the stdlib encoder's but
+        # isn't byte-identical: non-ASCII text is written as raw UTF-8 rather
+        # than \u escapes. Free-form evidence may hold non-str keys or values
+        # orjson rejects, so fall back to the stdlib encoder for those
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except TypeError:
+                pass
+        return json.dumps(data, indent=2)
 
-        md += f"""## Scan Details
+    def generate_markdown(self, result: ScanResult) -> str:
+        risk_level = result.risk_level
+        parts = [
+            _MD_HEADER.format(
+                timestamp=result.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                scan_id=result.scan_id,
+                scanner_version=result.scanner_version,
+                risk_level_label=risk_level.value.upper(),
+                risk_indicator=risk_level.indicator,
+                risk_score=result.overall_risk_score,
+                risk_message=risk_level.message,
+                critical_count=result.critical_count,
+                high_count=result.high_count,
+                medium_count=result.medium_count,
+                low_count=result.low_count,
+                info_count=result.info_count,
+                total_count=result.total_count,
+            )
+        ]
 
-- **Duration:** {result.duration_seconds:.2f} seconds
-- **Scanner Version:** {result.scanner_version}
+        if result.findings:
+            parts.append("## Detailed Findings\n\n")
 
-For more information, visit: https://github.com/yourusername/clawd-for-dummies
-"""
+            # Each finding adds many small fragments, so bind append locally
+            append = parts.append
+            for finding in result.findings:
+                severity = finding.severity
+                location = finding.location
+                append(
+                    _MD_FINDING.format(
+                        indicator=severity.indicator,
+                        title=finding.title,
+                        severity_label=severity.value.upper(),
+                        category=finding.category.display_name,
+                        cvss_score=finding.cvss_score,
+                        location_line=f"**Location:** {location}  " if location else "",
+                        description=finding.description,
+                        remediation=finding.remediation,
+                    )
+                )
+
+                if finding.remediation_steps:
+                    append("**Steps:**\n")
+                    for i, step in enumerate(finding.remediation_steps, 1):
+                        append(f"{i}. {step}\n")
+                    append("\n")
+
+                if finding.fix_prompt:
+                    append("#### AI Fix Prompt\n\n")
+                    append("Copy and paste this prompt to your AI assistant:\n\n")
+                    append(f"```\n{finding.fix_prompt}\n```\n\n")
+
+                if finding.reference_links:
+                    append("**References:**\n")
+                    for link in finding.reference_links:
+                        append(f"- {link}\n")
+                    append("\n")
+
+                append("---\n\n")
+        else:
+            parts.append(_MD_NO_FINDINGS)
+
+        parts.append(
+            _MD_FOOTER.format(
+                duration=result.duration_seconds,
+                scanner_version=result.scanner_version,
+            )
+        )
 
-        return md
+        return "".join(parts)
@@ -2,10 +2,14 @@
 Scanner orchestrator that coordinates security scanning modules.
 """
 
+import secrets
+import threading
 import time
-import uuid
+from itertools import chain
 from datetime import datetime
-from typing import List, Optional, Type
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Type, Union
 
 from clawd_for_dummies.models.finding import Finding
 from clawd_for_dummies.models.scan_result import ScanResult
@@ -24,58 +28,186 @@ from clawd_for_dummies.engine.clawdbot_security_scanner import (
 )
 
 
+@lru_cache(maxsize=None)
+def _describe_scanner(scanner_class: Type[BaseScanner]) -> str:
+    # Scanner descriptions are static, so build each one once
+    return scanner_class.get_description()
+
+
+# What a module's thread leaves behind: its findings, the error it raised, or
+# None while it is still running
+_Outcome = Union[List[Finding], Exception, None]
+
+
+def _run_scanner(
+    scanner: BaseScanner,
+    slots: threading.BoundedSemaphore,
+    outcomes: List[_Outcome],
+    index: int,
+) -> None:
+    # Thread target: store the module's findings, or the error it raised
+    with slots:
+        try:
+            outcomes[index] = scanner.scan()
+        except Exception as e:
+            outcomes[index] = e
+
+
 class SecurityScanner:
-    """Orchestrates all security scanning modules."""
-
-    SCANNER_REGISTRY: dict[str, Type[BaseScanner]] = {
-        "port": PortScanner,
-        "credential": CredentialScanner,
-        "config": ConfigAnalyzer,
-        "process": ProcessMonitor,
-        "permission": FilePermissionChecker,
-        "network": NetworkAnalyzer,
-        "clawdbot": ClawdbotSecurityScanner,
-    }
+    """Orchestrates all security scanning modules.
+
+    Modules run concurrently, at most ``max_workers`` at a time (default: all
+    of them). ``per_module_timeout`` is how many seconds ``run()`` waits for
+    the modules, counted from when they start; a module still running then is
+    reported as timed out, its findings are dropped and its thread is left to
+    finish in the background without delaying process exit.
+    """
+
+    SCANNER_REGISTRY: Mapping[str, Type[BaseScanner]] = MappingProxyType(
+        {
+            "port": PortScanner,
+            "credential": CredentialScanner,
+            "config": ConfigAnalyzer,
+            "process": ProcessMonitor,
+            "permission": FilePermissionChecker,
+            "network": NetworkAnalyzer,
+            "clawdbot": ClawdbotSecurityScanner,
+        }
+    )
+
+    _DEFAULT_MODULES: Tuple[str, ...] = tuple(SCANNER_REGISTRY)
 
     def __init__(
         self,
         modules: Optional[List[str]] = None,
         system_info: Optional[SystemInfo] = None,
         verbose: bool = False,
+        max_workers: Optional[int] = None,
+        per_module_timeout: Optional[float] = None,
     ):
-        self.modules = modules or list(self.SCANNER_REGISTRY.keys())
+        self.modules = modules or self._DEFAULT_MODULES
         self.system_info = system_info or SystemInfo.collect()
         self.verbose = verbose
+        self.max_workers = max_workers
+        self.per_module_timeout = per_module_timeout
         self.findings: List[Finding] = []
+        self._scanner_cache: Dict[str, BaseScanner] = {}
+
+    def reset_cache(self) -> None:
+        """Drop cached scanner instances, e.g. after changing ``system_info``."""
+        self._scanner_cache = {}
+
+    def _get_scanner(self, module_name: str) -> BaseScanner:
+        """Return the scanner for a module, creating it on first use.
+
+        Every scanner clears its findings at the start of ``scan()``, so an
+        instance can be reused across runs.
+        """
+        scanner = self._scanner_cache.get(module_name)
+        if (
+            scanner is None
+            or scanner.system_info is not self.system_info
+            or scanner.verbose != self.verbose
+        ):
+            scanner_class = self.SCANNER_REGISTRY[module_name]
+            scanner = scanner_class(self.system_info, self.verbose)
+            self._scanner_cache[module_name] = scanner
+        return scanner
+
+    def _evict_scanner(self, scanner: BaseScanner) -> None:
+        """Drop a scanner that failed or timed out from the instance cache."""
+        for module_name, cached in list(self._scanner_cache.items()):
+            if cached is scanner:
+                del self._scanner_cache[module_name]
 
     def run(self) -> ScanResult:
         start_time = time.time()
-        scan_id = str(uuid.uuid4())[:8]
+        scan_id = secrets.token_hex(4)
 
         self.findings = []
 
+        scanners: List[BaseScanner] = []
         for module_name in self.modules:
             if module_name not in self.SCANNER_REGISTRY:
                 if self.verbose:
                     print(f"Warning: Unknown module '{module_name}', skipping")
                 continue
 
-            scanner_class = self.SCANNER_REGISTRY[module_name]
-            scanner = scanner_class(self.system_info, self.verbose)
-
-            try:
+            scanners.append(self._get_scanner(module_name))
+
+        # Modules that read the same config files share one read per scan;
+        # the contents are dropped as soon as the scan ends
+        file_cache: Dict[str, bytes] = {}
+        for scanner in scanners:
+            scanner.file_cache = file_cache
+
+        if scanners:
+            # The modules are independent and mostly wait on sockets and
+            # subprocesses, so each runs in its own daemon thread; a module
+            # still running at the deadline is abandoned and doesn't hold up
+            # interpreter exit. Results are collected in module order so the
+            # findings order doesn't depend on timing, and progress lines are
+            # written in one call like BaseScanner.log.
+            outcomes: List[_Outcome] = [None] * len(scanners)
+            slots = threading.BoundedSemaphore(self.max_workers or len(scanners))
+            threads: List[threading.Thread] = []
+            for index, scanner in enumerate(scanners):
                 if self.verbose:
-                    print(f"Running {scanner.get_name()}...")
-
-                module_findings = scanner.scan()
-                self.findings.extend(module_findings)
-
-                if self.verbose:
-                    print(f"  Found {len(module_findings)} issues")
-
-            except Exception as e:
-                if self.verbose:
-                    print(f"  Error: {e}")
+                    print(f"Running {scanner.get_name()}...\n", end="")
+                thread = threading.Thread(
+                    target=_run_scanner,
+                    args=(scanner, slots, outcomes, index),
+                    name=f"scan-{scanner.get_name()}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+            # One deadline for every module, counted from when they started
+            deadline = (
+                None
+                if self.per_module_timeout is None
+                else time.monotonic() + self.per_module_timeout
+            )
+            partials: List[List[Finding]] = []
+            try:
+                for index, (scanner, thread) in enumerate(zip(scanners, threads)):
+                    thread.join(
+                        None
+                        if deadline is None
+                        else max(0.0, deadline - time.monotonic())
+                    )
+                    outcome = outcomes[index]
+
+                    if thread.is_alive():
+                        # The abandoned scan may still be writing to this
+                        # instance, so the next run must build a fresh one
+                        self._evict_scanner(scanner)
+                        if self.verbose:
+                            print(f"  {scanner.get_name()}: Timed out\n", end="")
+
+                    elif isinstance(outcome, Exception):
+                        self._evict_scanner(scanner)
+                        if self.verbose:
+                            print(
+                                f"  {scanner.get_name()}: Error: {outcome}\n", end=""
+                            )
+
+                    elif outcome is not None:
+                        partials.append(outcome)
+
+                        if self.verbose:
+                            print(
+                                f"  {scanner.get_name()}: "
+                                f"Found {len(outcome)} issues\n",
+                                end="",
+                            )
+            finally:
+                for scanner in scanners:
+                    scanner.file_cache = None
+                file_cache.clear()
+
+            self.findings = list(chain.from_iterable(partials))
 
         duration = time.time() - start_time
 
@@ -89,12 +221,11 @@ class SecurityScanner:
 
     @classmethod
     def list_available_modules(cls) -> List[str]:
-        return list(cls.SCANNER_REGISTRY.keys())
+        return list(cls._DEFAULT_MODULES)
 
     @classmethod
     def get_module_description(cls, module_name: str) -> str:
         if module_name not in cls.SCANNER_REGISTRY:
             return "Unknown module"
 
-        scanner_class = cls.SCANNER_REGISTRY[module_name]
-        return scanner_class.get_description()
+        return _describe_scanner(cls.SCANNER_REGISTRY[module_name])
@@ -8,7 +8,9 @@ from clawd_for_dummies.utils.secure import (
     mask_credential,
     sanitize_string,
     generate_secure_token,
+    generate_secure_tokens,
     secure_file_access,
+    read_config_cached,
     validate_type,
     validate_non_empty_string,
 )
@@ -22,7 +24,9 @@ __all__ = [
     "mask_credential",
     "sanitize_string",
     "generate_secure_token",
+    "generate_secure_tokens",
     "secure_file_access",
+    "read_config_cached",
     "validate_type",
     "validate_non_empty_string",
 ]
@@ -2,23 +2,56 @@
 Logging configuration for the application.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
+# Background thread draining file log records; replaced on each setup_logging
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_file_listener() -> None:
+    """Flush queued file records and stop the background listener."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging(
     level: str = "INFO",
     log_file: Optional[str] = None,
     format_string: Optional[str] = None,
+    trim_record_attributes: bool = False,
 ) -> logging.Logger:
-    """Configure and return the application logger."""
+    """Configure and return the application logger.
+
+    With ``trim_record_attributes`` the process-wide ``logging.logThreads``,
+    ``logProcesses``, ``logMultiprocessing`` and ``logAsyncioTasks`` flags are
+    switched off unless ``format_string`` uses them, which skips those lookups
+    for every log record. The flags affect every logger in the process, so
+    only the command-line entry point, which owns the process, turns this on.
+    """
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    if trim_record_attributes:
+        logging.logThreads = "%(thread" in format_string
+        logging.logProcesses = "%(process)" in format_string
+        logging.logMultiprocessing = "%(processName)" in format_string
+        if hasattr(logging, "logAsyncioTasks"):
+            logging.logAsyncioTasks = "%(taskName)" in format_string
+
     logger = logging.getLogger("clawd_for_dummies")
     logger.setLevel(getattr(logging, level.upper()))
     logger.handlers = []
+    _stop_file_listener()
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
@@ -31,7 +64,16 @@ def setup_logging(
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(format_string)
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+
+        # Hand records to a queue so callers (including concurrent scanner
+        # threads) don't block on disk writes; a listener thread writes them
+        global _file_listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _file_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
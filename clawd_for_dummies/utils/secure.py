@@ -2,14 +2,22 @@
 Secure data handling utilities for sensitive information management.
 """
 
+import base64
 import gc
+import os
 import secrets
-from typing import Any, Dict, Optional, Set, TypeVar, Generic
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Generic, Union
 from contextlib import contextmanager
 import ctypes
 
 T = TypeVar("T")
 
+# Null byte, DEL and C0 control characters other than newline, carriage
+# return and tab, deleted by sanitize_string in a single pass
+_SANITIZE_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(32) if chr(c) not in "\n\r\t") + "\x7f"
+)
+
 
 class SecureString:
     """String wrapper that securely handles sensitive data with memory clearing."""
@@ -19,7 +27,8 @@ class SecureString:
     def __init__(self, value: str) -> None:
         if not isinstance(value, str):
             raise TypeError("SecureString requires a string value")
-        self._data: bytes = value.encode("utf-8")
+        # A bytearray can be zeroed in place; immutable bytes can't
+        self._data: bytearray = bytearray(value.encode("utf-8"))
         self._cleared: bool = False
 
     def get_value(self) -> str:
@@ -29,21 +38,22 @@ class SecureString:
 
     def clear(self) -> None:
         if not self._cleared and self._data:
-            length = len(self._data)
             try:
                 self._overwrite_memory(self._data)
             except Exception:
                 pass
             finally:
-                self._data = b"\x00" * length
+                self._data = bytearray()
                 self._cleared = True
-                gc.collect()
 
     @staticmethod
-    def _overwrite_memory(data: bytes) -> None:
+    def _overwrite_memory(data: bytearray) -> None:
         try:
-            buffer = (ctypes.c_char * len(data)).from_buffer_copy(data)
+            # from_buffer shares the bytearray's storage, so the memset
+            # zeroes the secret itself rather than a copy of it
+            buffer = (ctypes.c_char * len(data)).from_buffer(data)
             ctypes.memset(ctypes.addressof(buffer), 0, len(data))
+            del buffer
         except Exception:
             pass
 
@@ -85,7 +95,6 @@ class SecureData(Generic[T]):
     def clear(self) -> None:
         self._value = None
         self._cleared = True
-        gc.collect()
 
     def __repr__(self) -> str:
         if self._cleared:
@@ -101,11 +110,8 @@ def mask_credential(credential: str, visible_chars: int = 4) -> str:
     if len(credential) <= visible_chars * 2:
         return "*" * len(credential)
 
-    return (
-        credential[:visible_chars]
-        + "*" * (len(credential) - visible_chars * 2)
-        + credential[-visible_chars:]
-    )
+    hidden = "*" * (len(credential) - visible_chars * 2)
+    return f"{credential[:visible_chars]}{hidden}{credential[-visible_chars:]}"
 
 
 def sanitize_string(value: str) -> str:
@@ -113,18 +119,7 @@ def sanitize_string(value: str) -> str:
     if not isinstance(value, str):
         return str(value)
 
-    sanitized = ""
-    for char in value:
-        code = ord(char)
-        if code == 0:
-            continue
-        if code < 32 and char not in "\n\r\t":
-            continue
-        if code == 127:
-            continue
-        sanitized += char
-
-    return sanitized
+    return value.translate(_SANITIZE_TABLE)
 
 
 def generate_secure_token(length: int = 32) -> str:
@@ -132,49 +127,103 @@ def generate_secure_token(length: int = 32) -> str:
     return secrets.token_urlsafe(length)
 
 
+def generate_secure_tokens(count: int, length: int = 32) -> List[str]:
+    """Generate several secure tokens from a single random read.
+
+    Each token matches ``generate_secure_token(length)`` in format.
+    """
+    raw = secrets.token_bytes(count * length)
+    return [
+        base64.urlsafe_b64encode(raw[start : start + length])
+        .rstrip(b"=")
+        .decode("ascii")
+        for start in range(0, count * length, length)
+    ]
+
+
 @contextmanager
-def secure_file_access(filepath: str, mode: str = "r", encoding: str = "utf-8"):
-    """Context manager for secure file access with cleanup."""
+def secure_file_access(
+    filepath: str,
+    mode: str = "r",
+    encoding: str = "utf-8",
+    aggressive_wipe: bool = False,
+):
+    """Context manager for secure file access with cleanup.
+
+    Set ``aggressive_wipe`` to force a garbage collection after closing the
+    file, for reads whose contents should be released as soon as possible.
+    """
     file_handle = None
+    open_kwargs = {} if "b" in mode else {"encoding": encoding}
     try:
-        if "b" in mode:
-            file_handle = open(filepath, mode)
-        else:
-            file_handle = open(filepath, mode, encoding=encoding)
+        file_handle = open(filepath, mode, **open_kwargs)
         yield file_handle
     finally:
         if file_handle:
             file_handle.close()
-        gc.collect()
+        if aggressive_wipe:
+            gc.collect()
+
+
+# Files larger than this are never kept in a read_config_cached cache
+_CACHED_FILE_MAX_BYTES = 1024 * 1024
+
+
+def read_config_cached(
+    path: Union[str, os.PathLike], cache: Optional[Dict[str, bytes]] = None
+) -> bytes:
+    """Read a configuration file, reusing contents already stored in ``cache``.
+
+    The cache is owned by the caller: ``SecurityScanner.run`` keeps one per
+    scan so modules reading the same file share one read, and clears it when
+    the scan ends. Without a cache the file is simply read.
+    """
+    path = os.fspath(path)
+    if cache is not None and path in cache:
+        return cache[path]
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if cache is not None and len(data) <= _CACHED_FILE_MAX_BYTES:
+        cache[path] = data
+    return data
 
 
 class SecureDict:
     """Dictionary that securely handles sensitive values."""
 
+    __slots__ = ("_data", "_sensitive_keys", "_unwrap")
+
     def __init__(self) -> None:
         self._data: Dict[str, Any] = {}
         self._sensitive_keys: Set[str] = set()
+        # Accessor for each wrapped value, chosen once in set() so get()
+        # doesn't need to type-check the stored value
+        self._unwrap: Dict[str, Callable[[], Any]] = {}
 
     def set(self, key: str, value: Any, sensitive: bool = False) -> None:
         if sensitive:
             if isinstance(value, str):
-                self._data[key] = SecureString(value)
+                wrapped = SecureString(value)
+                self._unwrap[key] = wrapped.get_value
             else:
-                self._data[key] = SecureData(value)
+                wrapped = SecureData(value)
+                self._unwrap[key] = wrapped.get
+            self._data[key] = wrapped
             self._sensitive_keys.add(key)
         else:
             self._data[key] = value
+            self._unwrap.pop(key, None)
 
     def get(self, key: str, default: Any = None) -> Any:
-        value = self._data.get(key, default)
-        if isinstance(value, (SecureString, SecureData)):
-            try:
-                if isinstance(value, SecureString):
-                    return value.get_value()
-                return value.get()
-            except ValueError:
-                return default
-        return value
+        unwrap = self._unwrap.get(key)
+        if unwrap is None:
+            return self._data.get(key, default)
+        try:
+            return unwrap()
+        except ValueError:
+            return default
 
     def clear_sensitive(self) -> None:
         for key in list(self._sensitive_keys):
@@ -184,15 +233,15 @@ class SecureDict:
                     value.clear()
                 del self._data[key]
         self._sensitive_keys.clear()
-        gc.collect()
+        self._unwrap.clear()
 
     def clear_all(self) -> None:
         self.clear_sensitive()
         self._data.clear()
-        gc.collect()
 
     def __repr__(self) -> str:
-        visible_keys = [k for k in self._data.keys() if k not in self._sensitive_keys]
+        # Set difference on the key view; sorted so the repr is stable
+        visible_keys = sorted(self._data.keys() - self._sensitive_keys)
         hidden_count = len(self._sensitive_keys)
         return f"SecureDict({visible_keys}, hidden={hidden_count})"
 
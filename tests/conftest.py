@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+
+from clawd_for_dummies.models.system_info import SystemInfo
+
+
+@pytest.fixture(scope="session")
+def sample_system_info():
+    """Create one set of host details for tests that only read it.
+
+    Tests that need different values should copy it with
+    ``dataclasses.replace`` rather than modifying the shared instance.
+    """
+    return SystemInfo(
+        hostname="test-host",
+        os_name="Linux",
+        python_version="3.9.0",
+    )
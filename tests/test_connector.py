@@ -2,8 +2,11 @@
 Tests for the Clawdbot connector module.
 """
 
+import socket
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+
+import pytest
 
 from clawd_for_dummies.connector import (
     ClawdbotConnector,
@@ -16,17 +19,84 @@ from clawd_for_dummies.connector import (
 )
 
 
+class _FakeSocket:
+    """Minimal stand-in for socket.socket in the discovery tests."""
+
+    def __init__(self, connect_result):
+        self.connect_result = connect_result
+        self.connect_calls = 0
+        self.closed = False
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect_ex(self, address):
+        self.connect_calls += 1
+        return self.connect_result
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(scope="module")
+def base_connector():
+    """Create one default connector shared by the tests in this module."""
+    return ClawdbotConnector()
+
+
+@pytest.fixture
+def connector(base_connector):
+    """Hand out the shared connector, resetting it after each test."""
+    yield base_connector
+    base_connector._reset_session()
+    base_connector._permission_callback = None
+
+
+@pytest.fixture
+def gateway_request(monkeypatch):
+    """Make discovery succeed and return the mock standing in for requests."""
+    send_request = Mock()
+    monkeypatch.setattr(ClawdbotConnector, "discover", lambda self: True)
+    monkeypatch.setattr(ClawdbotConnector, "_send_request", send_request)
+    return send_request
+
+
+@pytest.fixture(scope="module")
+def handshake_result():
+    """Build one successful handshake result for the read-only tests."""
+    return HandshakeResult(
+        success=True,
+        status=ConnectionStatus.AUTHENTICATED,
+        permission_level=PermissionLevel.SCAN,
+        session_id="test-session-123",
+        clawdbot_version="1.0.0",
+        message="Connected successfully",
+    )
+
+
+@pytest.fixture(scope="module")
+def handshake_dict(handshake_result):
+    """Serialize the shared handshake result once."""
+    return handshake_result.to_dict()
+
+
 class TestConnectionStatus:
     """Tests for ConnectionStatus enum."""
 
-    def test_status_values(self):
-        """Test all status values exist."""
-        assert ConnectionStatus.DISCONNECTED.value == "disconnected"
-        assert ConnectionStatus.CONNECTING.value == "connecting"
-        assert ConnectionStatus.AWAITING_PERMISSION.value == "awaiting_permission"
-        assert ConnectionStatus.CONNECTED.value == "connected"
-        assert ConnectionStatus.AUTHENTICATED.value == "authenticated"
-        assert ConnectionStatus.ERROR.value == "error"
+    @pytest.mark.parametrize(
+        "member, expected",
+        [
+            (ConnectionStatus.DISCONNECTED, "disconnected"),
+            (ConnectionStatus.CONNECTING, "connecting"),
+            (ConnectionStatus.AWAITING_PERMISSION, "awaiting_permission"),
+            (ConnectionStatus.CONNECTED, "connected"),
+            (ConnectionStatus.AUTHENTICATED, "authenticated"),
+            (ConnectionStatus.ERROR, "error"),
+        ],
+    )
+    def test_status_value(self, member, expected):
+        """Test each status value."""
+        assert member.value == expected
 
     def test_str_conversion(self):
         """Test string conversion."""
@@ -36,44 +106,48 @@ class TestConnectionStatus:
 class TestPermissionLevel:
     """Tests for PermissionLevel enum."""
 
-    def test_permission_values(self):
-        """Test all permission levels exist."""
-        assert PermissionLevel.NONE.value == "none"
-        assert PermissionLevel.READ_ONLY.value == "read_only"
-        assert PermissionLevel.SCAN.value == "scan"
-        assert PermissionLevel.FULL.value == "full"
+    @pytest.mark.parametrize(
+        "member, expected",
+        [
+            (PermissionLevel.NONE, "none"),
+            (PermissionLevel.READ_ONLY, "read_only"),
+            (PermissionLevel.SCAN, "scan"),
+            (PermissionLevel.FULL, "full"),
+        ],
+    )
+    def test_permission_value(self, member, expected):
+        """Test each permission level value."""
+        assert member.value == expected
 
 
 class TestHandshakeResult:
     """Tests for HandshakeResult dataclass."""
 
-    def test_creation(self):
+    def test_creation(self, handshake_result):
         """Test creating a HandshakeResult."""
-        result = HandshakeResult(
-            success=True,
-            status=ConnectionStatus.AUTHENTICATED,
-            permission_level=PermissionLevel.SCAN,
-            session_id="test-session-123",
-            clawdbot_version="1.0.0",
-            message="Connected successfully",
-        )
-
-        assert result.success is True
-        assert result.status == ConnectionStatus.AUTHENTICATED
-        assert result.permission_level == PermissionLevel.SCAN
-        assert result.session_id == "test-session-123"
-
-    def test_to_dict(self):
+        assert handshake_result.success is True
+        assert handshake_result.status == ConnectionStatus.AUTHENTICATED
+        assert handshake_result.permission_level == PermissionLevel.SCAN
+        assert handshake_result.session_id == "test-session-123"
+
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ("success", True),
+            ("status", "authenticated"),
+            ("permission_level", "scan"),
+            ("session_id", "test-session-123"),
+            ("clawdbot_version", "1.0.0"),
+            ("error", None),
+        ],
+    )
+    def test_to_dict_field(self, handshake_dict, key, expected):
         """Test converting to dictionary."""
-        result = HandshakeResult(
-            success=True,
-            status=ConnectionStatus.CONNECTED,
-        )
+        assert handshake_dict[key] == expected
 
-        data = result.to_dict()
-        assert data["success"] is True
-        assert data["status"] == "connected"
-        assert "timestamp" in data
+    def test_to_dict_timestamp(self, handshake_result, handshake_dict):
+        """Test the timestamp is serialized as ISO text."""
+        assert handshake_dict["timestamp"] == handshake_result.timestamp.isoformat()
 
     def test_error_result(self):
         """Test creating an error result."""
@@ -135,10 +209,8 @@ class TestSecurityCheckResponse:
 class TestClawdbotConnector:
     """Tests for ClawdbotConnector class."""
 
-    def test_initialization(self):
+    def test_initialization(self, connector):
         """Test connector initialization."""
-        connector = ClawdbotConnector()
-
         assert connector.host == "127.0.0.1"
         assert connector.port == 18789
         assert connector.status == ConnectionStatus.DISCONNECTED
@@ -152,9 +224,8 @@ class TestClawdbotConnector:
         assert connector.host == "192.168.1.100"
         assert connector.port == 9999
 
-    def test_is_connected_property(self):
+    def test_is_connected_property(self, connector):
         """Test is_connected property."""
-        connector = ClawdbotConnector()
         assert connector.is_connected is False
 
         connector._status = ConnectionStatus.CONNECTED
@@ -166,54 +237,49 @@ class TestClawdbotConnector:
         connector._status = ConnectionStatus.ERROR
         assert connector.is_connected is False
 
-    def test_permission_callback(self):
+    def test_permission_callback(self, connector):
         """Test setting permission callback."""
-        connector = ClawdbotConnector()
+        def callback(msg):
+            return True
 
-        callback = Mock(return_value=True)
         connector.set_permission_callback(callback)
 
         assert connector._permission_callback is callback
 
-    @patch("socket.socket")
-    def test_discover_when_running(self, mock_socket_class):
+    def test_discover_when_running(self, connector, monkeypatch):
         """Test discovering Clawdbot when it's running."""
-        mock_socket = Mock()
-        mock_socket.connect_ex.return_value = 0
-        mock_socket_class.return_value = mock_socket
+        fake = _FakeSocket(connect_result=0)
+        monkeypatch.setattr(socket, "socket", lambda *args: fake)
 
-        connector = ClawdbotConnector()
         result = connector.discover()
 
         assert result is True
-        mock_socket.connect_ex.assert_called_once()
-        mock_socket.close.assert_called_once()
+        assert fake.connect_calls == 1
+        assert fake.closed is True
 
-    @patch("socket.socket")
-    def test_discover_when_not_running(self, mock_socket_class):
+    def test_discover_when_not_running(self, connector, monkeypatch):
         """Test discovering Clawdbot when it's not running."""
-        mock_socket = Mock()
-        mock_socket.connect_ex.return_value = 1  # Connection refused
-        mock_socket_class.return_value = mock_socket
+        fake = _FakeSocket(connect_result=1)  # Connection refused
+        monkeypatch.setattr(socket, "socket", lambda *args: fake)
 
-        connector = ClawdbotConnector()
         result = connector.discover()
 
         assert result is False
 
-    @patch("socket.socket")
-    def test_discover_socket_error(self, mock_socket_class):
+    def test_discover_socket_error(self, monkeypatch):
         """Test discovering Clawdbot with socket error."""
-        mock_socket_class.side_effect = OSError("Network error")
+        def refuse(*args):
+            raise OSError("Network error")
+
+        monkeypatch.setattr(socket, "socket", refuse)
 
         connector = ClawdbotConnector(verbose=True)
         result = connector.discover()
 
         assert result is False
 
-    def test_disconnect_clears_data(self):
+    def test_disconnect_clears_data(self, connector):
         """Test that disconnect clears sensitive data."""
-        connector = ClawdbotConnector()
         connector._session_id = "test-session"
         connector._status = ConnectionStatus.CONNECTED
         connector._permission_level = PermissionLevel.SCAN
@@ -234,21 +300,18 @@ class TestClawdbotConnector:
         assert connector.status == ConnectionStatus.DISCONNECTED
         assert connector._session_id == ""
 
-    @patch.object(ClawdbotConnector, "discover", return_value=False)
-    def test_handshake_no_clawdbot(self, mock_discover):
+    def test_handshake_no_clawdbot(self, connector, monkeypatch):
         """Test handshake when Clawdbot is not running."""
-        connector = ClawdbotConnector()
+        monkeypatch.setattr(ClawdbotConnector, "discover", lambda self: False)
+
         result = connector.handshake()
 
         assert result.success is False
         assert result.status == ConnectionStatus.ERROR
         assert "not detected" in result.error.lower()
 
-    @patch.object(ClawdbotConnector, "discover", return_value=True)
-    @patch.object(ClawdbotConnector, "_send_request")
-    def test_handshake_with_callback_denied(self, mock_send, mock_discover):
+    def test_handshake_with_callback_denied(self, connector, gateway_request):
         """Test handshake when permission is denied via callback."""
-        connector = ClawdbotConnector()
         connector.set_permission_callback(lambda msg: False)
 
         result = connector.handshake()
@@ -257,17 +320,14 @@ class TestClawdbotConnector:
         assert result.status == ConnectionStatus.DISCONNECTED
         assert "denied" in result.message.lower()
 
-    @patch.object(ClawdbotConnector, "discover", return_value=True)
-    @patch.object(ClawdbotConnector, "_send_request")
-    def test_handshake_success(self, mock_send, mock_discover):
+    def test_handshake_success(self, connector, gateway_request):
         """Test successful handshake."""
-        mock_send.return_value = {
+        gateway_request.return_value = {
             "success": True,
             "granted_permission": "scan",
             "version": "2.0.0",
         }
 
-        connector = ClawdbotConnector()
         connector.set_permission_callback(lambda msg: True)
 
         result = connector.handshake()
@@ -277,18 +337,15 @@ class TestClawdbotConnector:
         assert result.permission_level == PermissionLevel.SCAN
         assert result.clawdbot_version == "2.0.0"
 
-    def test_request_security_check_not_connected(self):
+    def test_request_security_check_not_connected(self, connector):
         """Test security check when not connected."""
-        connector = ClawdbotConnector()
-
         response = connector.request_security_check("authentication")
 
         assert response.success is False
         assert "not connected" in response.error.lower()
 
-    def test_request_security_check_no_permission(self):
+    def test_request_security_check_no_permission(self, connector):
         """Test security check with no permission."""
-        connector = ClawdbotConnector()
         connector._status = ConnectionStatus.CONNECTED
         connector._permission_level = PermissionLevel.NONE
 
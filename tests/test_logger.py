@@ -0,0 +1,38 @@
+"""
+Tests for logging setup.
+"""
+
+import logging
+
+import pytest
+
+from clawd_for_dummies.utils.logger import setup_logging
+
+_RECORD_FLAGS = ("logThreads", "logProcesses", "logMultiprocessing")
+
+
+@pytest.fixture
+def record_flags(monkeypatch):
+    """Start with every LogRecord flag on and restore them afterwards."""
+    for flag in _RECORD_FLAGS:
+        monkeypatch.setattr(logging, flag, True)
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    def test_leaves_global_flags_alone_by_default(self, record_flags):
+        """Test a host application's record attributes are untouched."""
+        setup_logging("INFO")
+        assert all(getattr(logging, flag) for flag in _RECORD_FLAGS)
+
+    def test_trims_flags_when_asked(self, record_flags):
+        """Test the opt-in trims attributes the format doesn't use."""
+        setup_logging(
+            "INFO",
+            format_string="%(thread)d %(message)s",
+            trim_record_attributes=True,
+        )
+        assert logging.logThreads is True
+        assert logging.logProcesses is False
+        assert logging.logMultiprocessing is False
@@ -10,6 +10,35 @@ from clawd_for_dummies.models.scan_result import ScanResult, RiskLevel
 from clawd_for_dummies.models.system_info import SystemInfo
 
 
+# Fixed scan time for results whose timestamp the tests never inspect
+_SCAN_TIME = datetime(2024, 1, 1)
+
+# Minimal valid Finding arguments for tests that break one field at a time
+_VALID_FINDING_FIELDS = dict(
+    id="TEST",
+    title="Test",
+    description="Test",
+    severity=Severity.LOW,
+    category=Category.CONFIG,
+)
+
+# Read-only finding shared by tests that only serialize or inspect it
+_SAMPLE_FINDING = Finding(
+    id="TEST-001",
+    title="Test",
+    description="Test description",
+    severity=Severity.LOW,
+    category=Category.CONFIG,
+    remediation_steps=["Step 1"],
+)
+
+
+@pytest.fixture(scope="module")
+def collected_system_info():
+    """Collect the host's system info once for the tests that read it."""
+    return SystemInfo.collect()
+
+
 class TestFinding:
     """Tests for the Finding model."""
 
@@ -29,25 +58,14 @@ class TestFinding:
         assert finding.severity == Severity.HIGH
         assert finding.cvss_score == 7.5
 
-    def test_finding_validation(self):
+    @pytest.mark.parametrize(
+        "override",
+        [{"id": ""}, {"title": ""}, {"cvss_score": 10.5}],
+    )
+    def test_finding_validation(self, override):
         """Test finding validation."""
         with pytest.raises(ValueError):
-            Finding(
-                id="",
-                title="Test",
-                description="Test",
-                severity=Severity.LOW,
-                category=Category.CONFIG,
-            )
-
-        with pytest.raises(ValueError):
-            Finding(
-                id="TEST",
-                title="",
-                description="Test",
-                severity=Severity.LOW,
-                category=Category.CONFIG,
-            )
+            Finding(**{**_VALID_FINDING_FIELDS, **override})
 
     def test_severity_properties(self):
         """Test severity properties."""
@@ -57,32 +75,62 @@ class TestFinding:
 
     def test_finding_to_dict(self):
         """Test converting finding to dictionary."""
-        finding = Finding(
+        data = _SAMPLE_FINDING.to_dict()
+        assert data["id"] == "TEST-001"
+        assert data["severity"] == "low"
+        assert data["category"] == "config"
+
+    def test_finding_from_dict_without_validation(self):
+        """Test trusted deserialization round-trips without validation."""
+        restored = Finding.from_dict(_SAMPLE_FINDING.to_dict(), validate=False)
+        assert restored == _SAMPLE_FINDING
+
+    def test_finding_from_dict_accepts_datetime(self):
+        """Test an already-parsed timestamp is passed through."""
+        data = _SAMPLE_FINDING.to_dict()
+        data["timestamp"] = _SAMPLE_FINDING.timestamp
+        assert Finding.from_dict(data).timestamp is _SAMPLE_FINDING.timestamp
+
+    def test_finding_from_dict_validates_by_default(self):
+        """Test validated deserialization rejects an out-of-range CVSS score."""
+        data = _SAMPLE_FINDING.to_dict()
+        data["cvss_score"] = 15.0
+        with pytest.raises(ValueError):
+            Finding.from_dict(data)
+
+    def test_finding_copy_with(self):
+        """Test stamping out a finding from a template."""
+        template = Finding(
             id="TEST-001",
             title="Test",
             description="Test description",
             severity=Severity.LOW,
             category=Category.CONFIG,
+            remediation_steps=["Step 1"],
+            timestamp=datetime(2020, 1, 1),
         )
 
-        data = finding.to_dict()
-        assert data["id"] == "TEST-001"
-        assert data["severity"] == "low"
-        assert data["category"] == "config"
+        finding = template.copy_with(evidence={"key": "value"}, location="here")
+        finding.remediation_steps.append("Step 2")
+
+        assert finding.id == "TEST-001"
+        assert finding.evidence == {"key": "value"}
+        assert finding.location == "here"
+        assert finding.timestamp > template.timestamp
+        assert template.evidence == {}
+        assert template.remediation_steps == ["Step 1"]
 
 
 class TestScanResult:
     """Tests for the ScanResult model."""
 
-    def test_scan_result_creation(self):
+    def test_scan_result_creation(self, sample_system_info):
         """Test creating a scan result."""
-        system_info = SystemInfo()
-
         result = ScanResult(
             scan_id="test-123",
-            timestamp=datetime.now(),
+            timestamp=_SCAN_TIME,
             duration_seconds=5.0,
-            system_info=system_info,
+            system_info=sample_system_info,
             findings=[],
         )
 
@@ -90,10 +138,8 @@ class TestScanResult:
         assert result.duration_seconds == 5.0
         assert result.risk_level == RiskLevel.SAFE
 
-    def test_risk_calculation(self):
+    def test_risk_calculation(self, sample_system_info):
         """Test risk score calculation."""
-        system_info = SystemInfo()
-
         finding = Finding(
             id="TEST-001",
             title="Critical Test",
@@ -105,9 +151,9 @@ class TestScanResult:
 
         result = ScanResult(
             scan_id="test-123",
-            timestamp=datetime.now(),
+            timestamp=_SCAN_TIME,
             duration_seconds=1.0,
-            system_info=system_info,
+            system_info=sample_system_info,
             findings=[finding],
         )
 
@@ -144,10 +190,19 @@ class TestSystemInfo:
         mac_info = SystemInfo(os_name="Darwin")
         assert mac_info.is_macos is True
 
-    def test_system_info_collection(self):
+    def test_system_info_collection(self, collected_system_info):
         """Test system info auto-collection."""
-        info = SystemInfo.collect()
+        info = collected_system_info
 
         assert info.hostname != ""
         assert info.os_name != ""
         assert info.python_version != ""
+
+    def test_system_info_collect_is_cached(self):
+        """Test repeated collection reuses the cached host details."""
+        first = SystemInfo.collect()
+        second = SystemInfo.collect()
+
+        assert first == second
+        assert first is not second
+        assert first.local_ips is not second.local_ips
@@ -0,0 +1,105 @@
+"""
+Tests for the Network Analyzer.
+"""
+
+import json
+import time
+from dataclasses import replace
+
+import pytest
+
+from clawd_for_dummies.engine.network_analyzer import NetworkAnalyzer
+
+
+@pytest.fixture
+def system_info(sample_system_info, tmp_path):
+    """Create system info whose home directory is a fresh temp directory."""
+    return replace(sample_system_info, home_directory=str(tmp_path))
+
+
+@pytest.fixture
+def analyzer(system_info):
+    """Create a network analyzer for the temp home directory."""
+    return NetworkAnalyzer(system_info, verbose=False)
+
+
+def _probe_returning(monkeypatch, enabled):
+    """Replace the firewall probe, recording how often it runs."""
+    calls = []
+
+    def detect(self):
+        calls.append(self)
+        return enabled
+
+    monkeypatch.setattr(NetworkAnalyzer, "_detect_firewall", detect)
+    return calls
+
+
+def _write_cache(system_info, key, enabled, ts):
+    """Write a single firewall cache entry."""
+    cache_file = NetworkAnalyzer.firewall_cache_file(system_info)
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_text(json.dumps({key: {"enabled": enabled, "ts": ts}}))
+
+
+class TestFirewallCache:
+    """Tests for the on-disk firewall state cache."""
+
+    def test_cache_lives_under_scanned_home(self, system_info, tmp_path):
+        """Test the cache file follows system_info.home_directory."""
+        cache_file = NetworkAnalyzer.firewall_cache_file(system_info)
+        assert cache_file == tmp_path / ".cache" / "clawd" / "firewall_state.json"
+
+    def test_detected_firewall_is_cached(self, analyzer, monkeypatch):
+        """Test a positive probe is reused by the next check."""
+        calls = _probe_returning(monkeypatch, True)
+
+        assert analyzer._check_firewall() == []
+        assert analyzer._check_firewall() == []
+        assert len(calls) == 1
+
+    def test_missing_firewall_is_not_cached(self, analyzer, system_info, monkeypatch):
+        """Test a negative probe is re-checked on the next scan."""
+        calls = _probe_returning(monkeypatch, False)
+
+        findings = analyzer._check_firewall()
+        assert [f.id for f in findings] == ["CLAWD-NET-002"]
+        assert not NetworkAnalyzer.firewall_cache_file(system_info).exists()
+
+        analyzer._check_firewall()
+        assert len(calls) == 2
+
+    def test_expired_entry_is_ignored(self, analyzer, system_info, monkeypatch):
+        """Test an entry older than the TTL triggers a new probe."""
+        key = analyzer._firewall_cache_key()
+        stale = time.time() - NetworkAnalyzer.FIREWALL_CACHE_TTL - 1
+        _write_cache(system_info, key, True, stale)
+        calls = _probe_returning(monkeypatch, False)
+
+        findings = analyzer._check_firewall()
+
+        assert len(calls) == 1
+        assert [f.id for f in findings] == ["CLAWD-NET-002"]
+
+    def test_entry_for_other_host_is_ignored(
+        self, analyzer, system_info, monkeypatch
+    ):
+        """Test the cache is keyed by OS and hostname."""
+        assert analyzer._firewall_cache_key() == "Linux:test-host"
+        _write_cache(system_info, "Linux:other-host", True, time.time())
+        calls = _probe_returning(monkeypatch, False)
+
+        analyzer._check_firewall()
+
+        assert len(calls) == 1
+
+    def test_clear_firewall_cache(self, analyzer, system_info, monkeypatch):
+        """Test clearing removes the file and tolerates it being absent."""
+        _probe_returning(monkeypatch, True)
+        analyzer._check_firewall()
+        cache_file = NetworkAnalyzer.firewall_cache_file(system_info)
+        assert cache_file.exists()
+
+        NetworkAnalyzer.clear_firewall_cache(system_info)
+        assert not cache_file.exists()
+        NetworkAnalyzer.clear_firewall_cache(system_info)
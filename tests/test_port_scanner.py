@@ -0,0 +1,142 @@
+"""
+Tests for the Port Scanner.
+"""
+
+import socket
+from dataclasses import replace
+
+import pytest
+
+from clawd_for_dummies.engine.port_scanner import PortScanner
+
+# 18789 is 0x4965; addresses are 32-bit words in little-endian order
+_PROC_NET_TCP = """\
+  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 0100007F:0277 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1111 1 0000000000000000 100 0 0 10 0
+   1: 0100007F:4965 0100007F:C350 01 00000000:00000000 00:00000000 00000000  1000        0 2222 1 0000000000000000 20 4 30 10 -1
+   2: 00000000:4965 00000000:0000 0A 00000000:00000000 00:00000000 00000000  1000        0 3333 1 0000000000000000 100 0 0 10 0
+"""
+
+_PROC_NET_TCP6 = """\
+  sl  local_address                         remote_address                        st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000000000000000000001000000:4965 00000000000000000000000000000000:0000 0A 00000000:00000000 00:00000000 00000000  1000        0 4444 1 0000000000000000 100 0 0 10 0
+"""
+
+
+@pytest.fixture
+def port_scanner(sample_system_info):
+    """Create a port scanner for a Linux host."""
+    return PortScanner(sample_system_info, verbose=False)
+
+
+@pytest.fixture
+def listener():
+    """Listen on an ephemeral localhost port and return the port number."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    yield sock.getsockname()[1]
+    sock.close()
+
+
+class TestProcNetTcp:
+    """Tests for parsing the /proc/net/tcp socket tables."""
+
+    def test_finds_ipv4_listener(self):
+        """Test the listening row wins over a connected row on the same port."""
+        result = PortScanner._scan_proc_net_tcp(_PROC_NET_TCP.splitlines(), "4965")
+        assert result == ("0.0.0.0", "3333")
+
+    def test_finds_ipv6_listener(self):
+        """Test IPv6 addresses are decoded word by word."""
+        result = PortScanner._scan_proc_net_tcp(_PROC_NET_TCP6.splitlines(), "4965")
+        assert result == ("::1", "4444")
+
+    def test_no_listener(self):
+        """Test a port that nothing listens on."""
+        lines = _PROC_NET_TCP.splitlines()
+        assert PortScanner._scan_proc_net_tcp(lines, "1F90") is None
+
+    def test_reads_tables_from_disk(self, port_scanner, monkeypatch, tmp_path):
+        """Test port info is built from the configured table files."""
+        table = tmp_path / "tcp"
+        table.write_text(_PROC_NET_TCP)
+        tables = (str(tmp_path / "missing"), str(table))
+        monkeypatch.setattr(PortScanner, "PROC_NET_TCP_TABLES", tables)
+        monkeypatch.setattr(
+            PortScanner, "_find_socket_owner", staticmethod(lambda inode: None)
+        )
+
+        info = port_scanner._get_proc_net_port_info(18789)
+
+        assert info == {
+            "bind_address": "0.0.0.0",
+            "process_name": None,
+            "pid": None,
+        }
+
+    def test_unreadable_tables(self, port_scanner, monkeypatch, tmp_path):
+        """Test None is returned so callers fall back to other sources."""
+        monkeypatch.setattr(
+            PortScanner, "PROC_NET_TCP_TABLES", (str(tmp_path / "missing"),)
+        )
+        assert port_scanner._get_proc_net_port_info(18789) is None
+
+    @pytest.mark.parametrize(
+        "ip, expected",
+        [
+            ("0.0.0.0", "0.0.0.0"),
+            ("::", "0.0.0.0"),
+            ("127.0.0.53", "127.0.0.1"),
+            ("::1", "127.0.0.1"),
+            ("192.168.1.10", "192.168.1.10"),
+        ],
+    )
+    def test_normalize_bind_address(self, ip, expected):
+        """Test wildcard and loopback addresses are collapsed."""
+        assert PortScanner._normalize_bind_address(ip) == expected
+
+
+class TestBindProbe:
+    """Tests for detecting whether the gateway port is in use."""
+
+    def test_port_in_use(self, port_scanner, listener):
+        """Test a listening port is reported as in use."""
+        assert port_scanner._is_port_in_use(listener) is True
+
+    def test_port_free(self, port_scanner):
+        """Test a free port is reported as not in use."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        free_port = sock.getsockname()[1]
+        sock.close()
+
+        assert port_scanner._is_port_in_use(free_port) is False
+
+    def test_windows_uses_connect_probe(self, sample_system_info, listener):
+        """Test the Windows path connects instead of binding."""
+        scanner = PortScanner(replace(sample_system_info, os_name="Windows"))
+        assert scanner._is_port_in_use(listener) is True
+
+
+class TestPortScan:
+    """Tests for the findings reported by scan()."""
+
+    @pytest.mark.parametrize(
+        "bind_address, expected",
+        [("0.0.0.0", ["CLAWD-PORT-001"]), ("127.0.0.1", [])],
+    )
+    def test_exposed_gateway(
+        self, port_scanner, monkeypatch, bind_address, expected
+    ):
+        """Test only a wildcard bind is reported as exposed."""
+        status = {
+            "is_listening": True,
+            "bind_address": bind_address,
+            "process_name": "node",
+            "pid": "42",
+        }
+        monkeypatch.setattr(port_scanner, "_check_port_status", lambda port: status)
+        monkeypatch.setattr(port_scanner, "_check_auth_bypass", lambda: None)
+
+        assert [f.id for f in port_scanner.scan()] == expected
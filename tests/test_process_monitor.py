@@ -0,0 +1,146 @@
+"""
+Tests for the Process Monitor.
+"""
+
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from clawd_for_dummies.engine import process_monitor
+from clawd_for_dummies.engine.process_monitor import (
+    _CMDLINE_SECRET_FINDING,
+    ProcessMonitor,
+)
+
+
+class _FakeProc:
+    """Minimal stand-in for psutil.Process that records which fields are read."""
+
+    def __init__(self, pid, name="", cmdline=(), uid=1000):
+        self.pid = pid
+        self._name = name
+        self._cmdline = list(cmdline)
+        self._uid = uid
+        self.calls = []
+
+    def name(self):
+        self.calls.append("name")
+        return self._name
+
+    def cmdline(self):
+        self.calls.append("cmdline")
+        return self._cmdline
+
+    def uids(self):
+        self.calls.append("uids")
+        return SimpleNamespace(real=self._uid)
+
+
+@pytest.fixture
+def monitor(sample_system_info):
+    """Create a process monitor for a Linux host."""
+    return ProcessMonitor(sample_system_info, verbose=False)
+
+
+class TestCmdlineSecrets:
+    """Tests for secrets passed on the command line."""
+
+    def test_one_finding_per_process(self, monitor):
+        """Test several secrets in one cmdline produce a single finding."""
+        cmdline = ["moltbot", "--api-key=x", "-p", "y", "--token", "z"]
+
+        monitor._check_cmdline_secrets(_FakeProc(1), cmdline)
+        monitor._check_cmdline_secrets(_FakeProc(2), cmdline)
+
+        assert [f.evidence["pid"] for f in monitor.findings] == [1, 2]
+        assert all(f.id == "CLAWD-PROC-002" for f in monitor.findings)
+
+    def test_patterns_matched_in_order_without_duplicates(self, monitor):
+        """Test every kind of secret is listed once, in cmdline order."""
+        monitor._check_cmdline_secrets(_FakeProc(1), ["--api-key=x", "-p", "y"])
+
+        assert monitor.findings[0].evidence["patterns_matched"] == [
+            "API key/token in command line",
+            "Possible password in command line",
+        ]
+
+    def test_overlapping_flags_report_first_match(self, monitor):
+        """Test the single pass doesn't re-match text another pattern consumed."""
+        cmdline = ["moltbot", "--token", "-p", "hunter2"]
+
+        monitor._check_cmdline_secrets(_FakeProc(1), cmdline)
+
+        assert monitor.findings[0].evidence["patterns_matched"] == [
+            "API key/token in command line",
+        ]
+
+    @pytest.mark.parametrize(
+        "cmdline", [["moltbot", "gateway"], ["moltbot", "--verbose"]]
+    )
+    def test_no_secret_no_finding(self, monitor, cmdline):
+        """Test a cmdline without secret flags, with or without dashes."""
+        monitor._check_cmdline_secrets(_FakeProc(1), cmdline)
+        assert monitor.findings == []
+
+    def test_evidence_not_shared_with_template(self, monitor):
+        """Test per-process evidence never leaks into the shared template."""
+        template_evidence = dict(_CMDLINE_SECRET_FINDING.evidence)
+
+        monitor._check_cmdline_secrets(_FakeProc(1), ["--token", "z"])
+        finding = monitor.findings[0]
+        finding.evidence["extra"] = True
+
+        assert finding.evidence is not _CMDLINE_SECRET_FINDING.evidence
+        assert _CMDLINE_SECRET_FINDING.evidence == template_evidence
+
+
+class TestFindProcesses:
+    """Tests for locating Moltbot/Clawdbot processes."""
+
+    def test_matches_name_or_cmdline(self, monitor, monkeypatch):
+        """Test the cmdline is only read when the name doesn't match."""
+        by_name = _FakeProc(1, name="Clawdbot")
+        by_cmdline = _FakeProc(2, name="node", cmdline=["node", "moltbot.js"])
+        unrelated = _FakeProc(3, name="bash", cmdline=["bash"])
+        procs = [by_name, by_cmdline, unrelated]
+        monkeypatch.setattr(process_monitor.psutil, "process_iter", lambda: procs)
+
+        assert monitor._find_clawdbot_processes() == [by_name, by_cmdline]
+        assert by_name.calls == ["name"]
+        assert by_cmdline.calls == ["name", "cmdline"]
+
+    def test_vanished_process_is_skipped(self, monitor, monkeypatch):
+        """Test a process that exits mid-scan doesn't stop the search."""
+
+        class _GoneProc(_FakeProc):
+            def name(self):
+                raise process_monitor.psutil.NoSuchProcess(self.pid)
+
+        found = _FakeProc(2, name="moltbot")
+        procs = [_GoneProc(1), found]
+        monkeypatch.setattr(process_monitor.psutil, "process_iter", lambda: procs)
+
+        assert monitor._find_clawdbot_processes() == [found]
+
+
+class TestAnalyzeProcess:
+    """Tests for per-process checks."""
+
+    def test_uid_not_read_on_user_scan(self, monitor):
+        """Test a non-admin scan skips the root UID lookup."""
+        proc = _FakeProc(1, name="moltbot", cmdline=["moltbot"], uid=0)
+
+        monitor._analyze_process(proc)
+
+        assert "uids" not in proc.calls
+        assert monitor.findings == []
+
+    def test_root_process_on_admin_scan(self, sample_system_info):
+        """Test an admin scan reports a process running as root."""
+        monitor = ProcessMonitor(replace(sample_system_info, is_admin=True))
+        proc = _FakeProc(1, name="moltbot", cmdline=["moltbot"], uid=0)
+
+        monitor._analyze_process(proc)
+
+        assert [f.id for f in monitor.findings] == ["CLAWD-PROC-001"]
@@ -0,0 +1,63 @@
+"""
+Tests for the report generator.
+"""
+
+import json
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from clawd_for_dummies import report_generator
+from clawd_for_dummies.models.finding import Category, Finding, Severity
+from clawd_for_dummies.models.scan_result import ScanResult
+from clawd_for_dummies.report_generator import ReportGenerator
+
+orjson = pytest.importorskip("orjson")
+
+
+@pytest.fixture
+def result(sample_system_info):
+    """Create a scan result with non-ASCII text and non-str evidence keys."""
+    finding = Finding(
+        id="TEST-001",
+        title="Config für José",
+        description="Test description",
+        severity=Severity.HIGH,
+        category=Category.CONFIG,
+        evidence={"path": "/home/josé/.clawdbot", 18789: "port", None: "x"},
+        location="/home/josé/.clawdbot/clawdbot.json",
+    )
+    return ScanResult(
+        scan_id="test-123",
+        timestamp=datetime(2024, 1, 1),
+        duration_seconds=1.0,
+        system_info=replace(
+            sample_system_info, hostname="café-host", home_directory="/home/josé"
+        ),
+        findings=[finding],
+    )
+
+
+class TestGenerateJson:
+    """Tests for the JSON report."""
+
+    def test_orjson_matches_stdlib(self, result, monkeypatch):
+        """Test both encoders produce reports that decode to the same data."""
+        monkeypatch.setattr(report_generator, "orjson", None)
+        stdlib_report = ReportGenerator().generate_json(result)
+        monkeypatch.setattr(report_generator, "orjson", orjson)
+        orjson_report = ReportGenerator().generate_json(result)
+
+        assert "\\u00e9" in stdlib_report
+        assert "é" in orjson_report
+        assert json.loads(orjson_report) == json.loads(stdlib_report)
+
+    def test_unsupported_evidence_falls_back_to_stdlib(self, result, monkeypatch):
+        """Test evidence orjson rejects is still encoded."""
+        monkeypatch.setattr(report_generator, "orjson", orjson)
+        result.findings[0].evidence["size"] = 2**70
+
+        report = json.loads(ReportGenerator().generate_json(result))
+
+        assert report["findings"][0]["evidence"]["size"] == 2**70
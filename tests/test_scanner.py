@@ -0,0 +1,231 @@
+"""
+Tests for the scanner orchestrator.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from clawd_for_dummies.engine.base_scanner import BaseScanner
+from clawd_for_dummies.models.finding import Category, Finding, Severity
+from clawd_for_dummies.scanner import SecurityScanner
+from clawd_for_dummies.utils.secure import read_config_cached
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _make_scanner(name, scan):
+    """Build a scanner class whose scan() runs ``scan(self)``."""
+
+    class _Scanner(BaseScanner):
+        def scan(self):
+            return scan(self)
+
+        @classmethod
+        def get_name(cls):
+            return name
+
+        @classmethod
+        def get_description(cls):
+            return f"Test scanner {name}"
+
+    return _Scanner
+
+
+def _finding(finding_id):
+    return Finding(
+        id=finding_id,
+        title="Test",
+        description="Test",
+        severity=Severity.LOW,
+        category=Category.OTHER,
+    )
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Install test scanners in place of the real modules."""
+
+    def install(**scanners):
+        monkeypatch.setattr(
+            SecurityScanner, "SCANNER_REGISTRY", MappingProxyType(scanners)
+        )
+        return list(scanners)
+
+    return install
+
+
+class TestSecurityScanner:
+    """Tests for the SecurityScanner orchestrator."""
+
+    def test_file_cache_shared_and_dropped(
+        self, registry, sample_system_info, tmp_path
+    ):
+        """Test modules share file reads during a scan and nothing outlives it."""
+        config = tmp_path / "config.json"
+        config.write_bytes(b"{}")
+        seen = []
+
+        def scan(self):
+            read_config_cached(config, self.file_cache)
+            seen.append(self.file_cache)
+            return []
+
+        modules = registry(a=_make_scanner("a", scan), b=_make_scanner("b", scan))
+        scanner = SecurityScanner(modules, sample_system_info)
+        scanner.run()
+
+        assert seen[0] is seen[1]
+        assert seen[0] == {}
+        assert all(s.file_cache is None for s in scanner._scanner_cache.values())
+
+    def test_findings_in_module_order(self, registry, sample_system_info):
+        """Test findings follow module order, not completion order."""
+
+        def slow(self):
+            time.sleep(0.2)
+            return [_finding("SLOW")]
+
+        def fast(self):
+            return [_finding("FAST")]
+
+        modules = registry(
+            slow=_make_scanner("slow", slow), fast=_make_scanner("fast", fast)
+        )
+        result = SecurityScanner(modules, sample_system_info).run()
+
+        assert [f.id for f in result.findings] == ["SLOW", "FAST"]
+
+    def test_module_error_skips_only_that_module(
+        self, registry, sample_system_info, capsys
+    ):
+        """Test a module that raises is reported and the others still count."""
+
+        def broken(self):
+            raise RuntimeError("boom")
+
+        def working(self):
+            return [_finding("OK")]
+
+        modules = registry(
+            broken=_make_scanner("broken", broken),
+            working=_make_scanner("working", working),
+        )
+        result = SecurityScanner(modules, sample_system_info, verbose=True).run()
+
+        assert [f.id for f in result.findings] == ["OK"]
+        assert "broken: Error: boom" in capsys.readouterr().out
+
+    def test_timeout_is_one_deadline(self, registry, sample_system_info):
+        """Test slow modules share one deadline instead of adding up."""
+        release = threading.Event()
+
+        def hang(self):
+            release.wait(5)
+            return [_finding("LATE")]
+
+        def quick(self):
+            return [_finding("OK")]
+
+        modules = registry(
+            hang1=_make_scanner("hang1", hang),
+            hang2=_make_scanner("hang2", hang),
+            hang3=_make_scanner("hang3", hang),
+            quick=_make_scanner("quick", quick),
+        )
+        scanner = SecurityScanner(modules, sample_system_info, per_module_timeout=0.3)
+        try:
+            start = time.monotonic()
+            result = scanner.run()
+            elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        assert [f.id for f in result.findings] == ["OK"]
+        # Waiting 0.3s per hung module in turn would take at least 0.9s
+        assert elapsed < 0.8
+
+    def test_failed_and_timed_out_scanners_are_not_reused(
+        self, registry, sample_system_info
+    ):
+        """Test the next run builds fresh instances for modules that failed."""
+        release = threading.Event()
+
+        def hang(self):
+            release.wait(5)
+            return []
+
+        def broken(self):
+            raise RuntimeError("boom")
+
+        def working(self):
+            return []
+
+        modules = registry(
+            hang=_make_scanner("hang", hang),
+            broken=_make_scanner("broken", broken),
+            working=_make_scanner("working", working),
+        )
+        scanner = SecurityScanner(modules, sample_system_info, per_module_timeout=0.1)
+        try:
+            scanner.run()
+        finally:
+            release.set()
+
+        assert list(scanner._scanner_cache) == ["working"]
+
+    def test_max_workers_limits_concurrency(self, registry, sample_system_info):
+        """Test no more than max_workers modules run at once."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def scan(self):
+            with lock:
+                running.append(self)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(self)
+            return []
+
+        modules = registry(**{name: _make_scanner(name, scan) for name in "abcd"})
+        SecurityScanner(modules, sample_system_info, max_workers=2).run()
+
+        assert max(peak) <= 2
+
+    def test_timed_out_module_does_not_delay_exit(self):
+        """Test the process exits without waiting for an abandoned module."""
+        code = """
+import time
+from types import MappingProxyType
+from clawd_for_dummies.engine.base_scanner import BaseScanner
+from clawd_for_dummies.models.system_info import SystemInfo
+from clawd_for_dummies.scanner import SecurityScanner
+
+class Hang(BaseScanner):
+    def scan(self):
+        time.sleep(30)
+        return []
+
+    @classmethod
+    def get_name(cls):
+        return "hang"
+
+    @classmethod
+    def get_description(cls):
+        return "hang"
+
+SecurityScanner.SCANNER_REGISTRY = MappingProxyType({"hang": Hang})
+SecurityScanner(["hang"], SystemInfo(), per_module_timeout=0.1).run()
+"""
+        start = time.monotonic()
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, timeout=20, cwd=_REPO_ROOT
+        )
+        assert time.monotonic() - start < 10
@@ -2,8 +2,6 @@
 Tests for secure data handling utilities.
 """
 
-import os
-import tempfile
 import pytest
 
 from clawd_for_dummies.utils.secure import (
@@ -13,7 +11,9 @@ from clawd_for_dummies.utils.secure import (
     mask_credential,
     sanitize_string,
     generate_secure_token,
+    generate_secure_tokens,
     secure_file_access,
+    read_config_cached,
     validate_type,
     validate_non_empty_string,
 )
@@ -25,7 +25,7 @@ class TestSecureString:
     def test_creation(self):
         """Test creating a SecureString."""
         secret = SecureString("my_secret_password")
-        assert len(secret) == len("my_secret_password".encode("utf-8"))
+        assert len(secret) == len(b"my_secret_password")
         assert bool(secret) is True
 
     def test_get_value(self):
@@ -42,6 +42,13 @@ class TestSecureString:
         with pytest.raises(ValueError):
             secret.get_value()
 
+    def test_clear_zeroes_original_buffer(self):
+        """Test clearing overwrites the stored bytes in place."""
+        secret = SecureString("my_secret")
+        buffer = secret._data
+        secret.clear()
+        assert buffer == bytearray(len("my_secret"))
+
     def test_repr_hides_value(self):
         """Test that repr doesn't expose the value."""
         secret = SecureString("my_secret")
@@ -84,6 +91,15 @@ class TestSecureData:
         assert "sensitive" not in repr(data)
 
 
+@pytest.fixture
+def populated_secure_dict():
+    """Create a SecureDict holding one regular and one sensitive value."""
+    d = SecureDict()
+    d.set("regular", "value1")
+    d.set("sensitive", "value2", sensitive=True)
+    return d
+
+
 class TestSecureDict:
     """Tests for SecureDict class."""
 
@@ -99,87 +115,66 @@ class TestSecureDict:
         d.set("password", "secret123", sensitive=True)
         assert d.get("password") == "secret123"
 
-    def test_clear_sensitive(self):
+    def test_clear_sensitive(self, populated_secure_dict):
         """Test clearing sensitive data only."""
-        d = SecureDict()
-        d.set("regular", "value1")
-        d.set("sensitive", "value2", sensitive=True)
-
-        d.clear_sensitive()
+        populated_secure_dict.clear_sensitive()
 
-        assert d.get("regular") == "value1"
-        assert d.get("sensitive") is None
+        assert populated_secure_dict.get("regular") == "value1"
+        assert populated_secure_dict.get("sensitive") is None
 
-    def test_clear_all(self):
+    def test_clear_all(self, populated_secure_dict):
         """Test clearing all data."""
-        d = SecureDict()
-        d.set("key1", "value1")
-        d.set("key2", "value2", sensitive=True)
-
-        d.clear_all()
+        populated_secure_dict.clear_all()
 
-        assert d.get("key1") is None
-        assert d.get("key2") is None
+        assert populated_secure_dict.get("regular") is None
+        assert populated_secure_dict.get("sensitive") is None
 
-    def test_repr_hides_sensitive(self):
+    def test_repr_hides_sensitive(self, populated_secure_dict):
         """Test that repr shows hidden count."""
-        d = SecureDict()
-        d.set("visible", "value")
-        d.set("hidden", "secret", sensitive=True)
-
-        repr_str = repr(d)
+        repr_str = repr(populated_secure_dict)
         assert "hidden=1" in repr_str
+        assert "value2" not in repr_str
 
 
 class TestMaskCredential:
     """Tests for mask_credential function."""
 
-    def test_mask_long_credential(self):
-        """Test masking a long credential."""
-        masked = mask_credential("sk-ant-REDACTED")
-        assert masked.startswith("sk-a")
-        assert masked.endswith("cdef")
-        assert "*" in masked
-
-    def test_mask_short_credential(self):
-        """Test masking a short credential."""
-        masked = mask_credential("short")
-        assert masked == "*****"
-
-    def test_mask_empty_credential(self):
-        """Test masking empty credential."""
-        assert mask_credential("") == ""
-
-    def test_custom_visible_chars(self):
-        """Test custom visible character count."""
-        masked = mask_credential("1234567890", visible_chars=2)
-        assert masked.startswith("12")
-        assert masked.endswith("90")
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            # Long credentials keep four characters at each end
+            (("sk-ant-REDACTED",), "sk-a*********************cdef"),
+            # Short credentials are masked entirely
+            (("short",), "*****"),
+            (("",), ""),
+            # Custom visible character count
+            (("1234567890", 2), "12******90"),
+        ],
+    )
+    def test_mask(self, args, expected):
+        """Test masking credentials of different lengths."""
+        assert mask_credential(*args) == expected
 
 
 class TestSanitizeString:
     """Tests for sanitize_string function."""
 
-    def test_removes_null_bytes(self):
-        """Test removal of null bytes."""
-        result = sanitize_string("hello\x00world")
-        assert result == "helloworld"
-        assert "\x00" not in result
-
-    def test_removes_control_characters(self):
-        """Test removal of control characters."""
-        result = sanitize_string("hello\x01\x02world")
-        assert result == "helloworld"
-
-    def test_preserves_newlines_and_tabs(self):
-        """Test that newlines and tabs are preserved."""
-        result = sanitize_string("hello\nworld\there")
-        assert result == "hello\nworld\there"
-
-    def test_handles_non_string(self):
-        """Test handling of non-string input."""
-        result = sanitize_string(12345)
-        assert result == "12345"
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            # Null bytes are removed
+            ("hello\x00world", "helloworld"),
+            # Other control characters are removed
+            ("hello\x01\x02world", "helloworld"),
+            # Newlines and tabs are kept
+            ("hello\nworld\there", "hello\nworld\there"),
+            # Non-strings are converted first
+            (12345, "12345"),
+        ],
+    )
+    def test_sanitize(self, value, expected):
+        """Test control characters are stripped and text is kept."""
+        assert sanitize_string(value) == expected
 
 
 class TestGenerateSecureToken:
@@ -198,18 +193,29 @@ class TestGenerateSecureToken:
 
     def test_tokens_are_unique(self):
         """Test that tokens are unique."""
-        tokens = [generate_secure_token() for _ in range(100)]
-        assert len(set(tokens)) == 100
+        tokens = {generate_secure_token() for _ in range(16)}
+        assert len(tokens) == 16
+        # 32 random bytes encode to at least 43 URL-safe base64 characters
+        assert len(generate_secure_token()) >= 43
+
+    def test_batch_generation(self):
+        """Test generating several tokens at once."""
+        tokens = generate_secure_tokens(50, 16)
+        assert len(tokens) == 50
+        assert len(set(tokens)) == 50
+        assert all(len(t) == len(generate_secure_token(16)) for t in tokens)
 
 
 class TestValidateType:
     """Tests for validate_type function."""
 
-    def test_valid_type(self):
+    @pytest.mark.parametrize(
+        "value, expected_type",
+        [("hello", str), (123, int), ([1, 2], list)],
+    )
+    def test_valid_type(self, value, expected_type):
         """Test validation passes for correct type."""
-        validate_type("hello", str)
-        validate_type(123, int)
-        validate_type([1, 2], list)
+        validate_type(value, expected_type)
 
     def test_invalid_type(self):
         """Test validation fails for wrong type."""
@@ -244,76 +250,79 @@ class TestValidateNonEmptyString:
             validate_non_empty_string(123)  # type: ignore
 
 
+@pytest.fixture(scope="module")
+def text_tmpfile(tmp_path_factory):
+    """Create one read-only text file shared by the file access tests."""
+    path = tmp_path_factory.mktemp("secure") / "text.txt"
+    path.write_text("test content")
+    return path
+
+
+@pytest.fixture(scope="module")
+def binary_tmpfile(tmp_path_factory):
+    """Create one read-only binary file shared by the file access tests."""
+    path = tmp_path_factory.mktemp("secure") / "data.bin"
+    path.write_bytes(b"binary data")
+    return path
+
+
 class TestSecureFileAccess:
     """Tests for secure_file_access context manager."""
 
-    def test_read_file(self):
+    def test_read_file(self, text_tmpfile):
         """Test reading a file with secure access."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("test content")
-            temp_path = f.name
+        with secure_file_access(str(text_tmpfile), "r") as f:
+            content = f.read()
+        assert content == "test content"
 
-        try:
-            with secure_file_access(temp_path, "r") as f:
-                content = f.read()
-            assert content == "test content"
-        finally:
-            os.unlink(temp_path)
-
-    def test_write_file(self):
+    def test_write_file(self, tmp_path):
         """Test writing a file with secure access."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            temp_path = f.name
+        temp_path = tmp_path / "out.txt"
 
-        try:
-            with secure_file_access(temp_path, "w") as f:
-                f.write("secure content")
+        with secure_file_access(str(temp_path), "w") as f:
+            f.write("secure content")
 
-            with open(temp_path, "r") as f:
-                assert f.read() == "secure content"
-        finally:
-            os.unlink(temp_path)
+        assert temp_path.read_text() == "secure content"
 
-    def test_binary_mode(self):
+    def test_binary_mode(self, binary_tmpfile):
         """Test binary mode file access."""
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-            f.write(b"binary data")
-            temp_path = f.name
-
-        try:
-            with secure_file_access(temp_path, "rb") as f:
-                content = f.read()
-            assert content == b"binary data"
-        finally:
-            os.unlink(temp_path)
-
-    def test_file_closed_after_context(self):
-        """Test that file is properly closed after context exits."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("test")
-            temp_path = f.name
-
-        try:
-            with secure_file_access(temp_path, "r") as f:
-                pass
-            assert f.closed
-        finally:
-            os.unlink(temp_path)
-
-    def test_file_closed_on_exception(self):
-        """Test that file is closed even if exception occurs."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("test")
-            temp_path = f.name
+        with secure_file_access(str(binary_tmpfile), "rb") as f:
+            content = f.read()
+        assert content == b"binary data"
 
+    @pytest.mark.parametrize("raise_error", [False, True])
+    def test_file_closed(self, text_tmpfile, raise_error):
+        """Test that the file is closed when the context exits, even on error."""
         file_handle = None
         try:
-            try:
-                with secure_file_access(temp_path, "r") as f:
-                    file_handle = f
+            with secure_file_access(str(text_tmpfile), "r") as f:
+                file_handle = f
+                if raise_error:
                     raise ValueError("Intentional error")
-            except ValueError:
-                pass  # Expected
-            assert file_handle.closed
-        finally:
-            os.unlink(temp_path)
+        except ValueError:
+            pass  # Expected
+        assert file_handle.closed
+
+
+class TestReadConfigCached:
+    """Tests for read_config_cached function."""
+
+    def test_reads_through_cache(self, tmp_path):
+        """Test a cache serves later reads of the same file."""
+        path = tmp_path / "config.json"
+        path.write_bytes(b'{"a": 1}')
+        cache = {}
+
+        assert read_config_cached(path, cache) == b'{"a": 1}'
+        path.write_bytes(b'{"a": 2}')
+        assert read_config_cached(path, cache) == b'{"a": 1}'
+        assert cache == {str(path): b'{"a": 1}'}
+
+    def test_reads_file_without_cache(self, tmp_path):
+        """Test every uncached read sees the current contents."""
+        path = tmp_path / "config.json"
+        path.write_bytes(b'{"a": 1}')
+        assert read_config_cached(path) == b'{"a": 1}'
+
+        path.write_bytes(b'{"b": 2}')
+        assert read_config_cached(path) == b'{"b": 2}'